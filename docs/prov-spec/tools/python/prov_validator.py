@@ -23,8 +23,9 @@ import hashlib
 import json
 import re
 import sys
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 # Spec version
 SPEC_VERSION = "0.1.0"
@@ -39,8 +40,9 @@ STABLE_NAMESPACES = {"adapter", "engine", "integrity", "lineage"}
 RESERVED_NAMESPACES = {"policy", "attestation", "execution", "audit"}
 
 
+@cache
 def find_spec_root() -> Path:
-    """Find the spec root directory."""
+    """Find the spec root directory (probed once per process)."""
     # Try relative to this file
     here = Path(__file__).parent
     candidates = [
@@ -60,14 +62,29 @@ def load_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+@cache
 def load_method_catalog() -> Dict[str, Any]:
-    """Load the method catalog from spec/methods.json."""
+    """Load the method catalog from spec/methods.json.
+
+    Parsed once per process; the returned dict is shared, so callers must
+    not mutate it.
+    """
     spec_path = find_spec_root() / "methods.json"
     if spec_path.exists():
         return load_json(spec_path)
     return {"methods": [], "namespaces": {}}
 
 
+@cache
+def _known_method_ids() -> FrozenSet[str]:
+    """IDs in the loaded method catalog."""
+    return frozenset(m["id"] for m in load_method_catalog().get("methods", []))
+
+
+# Reused across calls; json.dumps builds a new encoder for non-default options
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
 def canonical_json(obj: Any) -> str:
     """Serialize to canonical JSON for stable hashing.
 
@@ -75,7 +92,7 @@ def canonical_json(obj: Any) -> str:
     - No whitespace
     - UTF-8
     """
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _CANONICAL_ENCODER.encode(obj)
 
 
 def compute_sha256(data: bytes) -> str:
@@ -127,7 +144,18 @@ def validate_method_id_catalog(
     Returns:
         (is_valid, error_message)
     """
-    known_ids = {m["id"] for m in catalog.get("methods", [])}
+    return _check_catalog(method_id, _catalog_ids(catalog))
+
+
+def _catalog_ids(catalog: Dict[str, Any]) -> FrozenSet[str]:
+    """IDs in a catalog (cached for the loaded catalog)."""
+    if catalog is load_method_catalog():
+        return _known_method_ids()
+    return frozenset(m["id"] for m in catalog.get("methods", []))
+
+
+def _check_catalog(method_id: str, known_ids: FrozenSet[str]) -> Tuple[bool, Optional[str]]:
+    """Catalog membership check against a precomputed ID set."""
     if method_id not in known_ids:
         return False, f"Method ID '{method_id}' is not in the catalog"
     return True, None
@@ -146,7 +174,7 @@ def validate_methods_in_record(
         List of validation issues
     """
     issues = []
-    catalog = load_method_catalog() if strict else {"methods": []}
+    known_ids = _known_method_ids() if strict else frozenset()
 
     methods = record.get("methods", [])
     if not methods:
@@ -170,7 +198,7 @@ def validate_methods_in_record(
 
         # Check catalog membership (strict mode only)
         if strict:
-            valid, error = validate_method_id_catalog(method_id, catalog)
+            valid, error = _check_catalog(method_id, known_ids)
             if not valid:
                 issues.append({"level": "warning", "message": error})
 
@@ -187,7 +215,7 @@ def validate_capability_manifest(manifest: Dict[str, Any]) -> List[Dict[str, Any
         List of validation issues
     """
     issues = []
-    catalog = load_method_catalog()
+    known_ids = _known_method_ids()
 
     # Check schema version
     if manifest.get("schema") != "prov-capabilities@v0.1":
@@ -202,7 +230,7 @@ def validate_capability_manifest(manifest: Dict[str, Any]) -> List[Dict[str, Any
         if not valid:
             issues.append({"level": "error", "message": error})
         else:
-            valid, error = validate_method_id_catalog(method_id, catalog)
+            valid, error = _check_catalog(method_id, known_ids)
             if not valid:
                 issues.append({"level": "warning", "message": error})
 
@@ -253,7 +281,8 @@ def check_test_vector(vector_id: str, expect_fail: bool = False) -> List[Dict[st
     if vector_id == "integrity.digest.sha256":
         # Compute digest and compare
         computed_canonical = canonical_json(input_data)
-        computed_digest = compute_artifact_digest(input_data)
+        # Hash the canonical text directly rather than re-serializing input_data
+        computed_digest = compute_artifact_digest(computed_canonical)
 
         if computed_canonical != expected.get("canonical_form"):
             issues.append({
@@ -305,6 +334,65 @@ def check_test_vector(vector_id: str, expect_fail: bool = False) -> List[Dict[st
     return issues
 
 
+Issues = List[Dict[str, Any]]
+
+
+def _handle_validate_methods(args: argparse.Namespace) -> Optional[Issues]:
+    record = load_json(args.file)
+    # Handle envelope vs raw record
+    if record.get("schema_version") == "mcp.envelope.v0.1":
+        record = record.get("provenance", {})
+    return validate_methods_in_record(record, strict=args.strict)
+
+
+def _handle_validate_manifest(args: argparse.Namespace) -> Optional[Issues]:
+    manifest = load_json(args.file)
+    return validate_capability_manifest(manifest)
+
+
+def _handle_check_vector(args: argparse.Namespace) -> Optional[Issues]:
+    return check_test_vector(args.vector_id, expect_fail=getattr(args, "expect_fail", False))
+
+
+def _handle_list_methods(args: argparse.Namespace) -> Optional[Issues]:
+    catalog = load_method_catalog()
+    print(f"prov-spec v{SPEC_VERSION} - Known method IDs:\n")
+    for method in catalog.get("methods", []):
+        status = method.get("status", "unknown")
+        print(f"  [{status:11}] {method['id']}")
+        print(f"               {method.get('summary', '')}")
+    return None
+
+
+def _handle_list_vectors(args: argparse.Namespace) -> Optional[Issues]:
+    spec_root = find_spec_root()
+    vectors_path = spec_root / "vectors"
+    print(f"prov-spec v{SPEC_VERSION} - Test vectors:\n")
+    if vectors_path.exists():
+        for vector_dir in sorted(vectors_path.iterdir()):
+            if vector_dir.is_dir():
+                has_positive = (vector_dir / "input.json").exists()
+                has_negative = (vector_dir / "negative").exists()
+                markers = []
+                if has_positive:
+                    markers.append("positive")
+                if has_negative:
+                    markers.append("negative")
+                print(f"  {vector_dir.name} ({', '.join(markers)})")
+    return None
+
+
+# Command handlers. A handler returns issues to report, or None when it has
+# printed its own output; only the handlers that need the method catalog load it.
+_HANDLERS: Dict[str, Callable[[argparse.Namespace], Optional[Issues]]] = {
+    "validate-methods": _handle_validate_methods,
+    "validate-manifest": _handle_validate_manifest,
+    "check-vector": _handle_check_vector,
+    "list-methods": _handle_list_methods,
+    "list-vectors": _handle_list_vectors,
+}
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -361,50 +449,15 @@ def main():
 
     args = parser.parse_args()
 
-    if args.command == "validate-methods":
-        record = load_json(args.file)
-        # Handle envelope vs raw record
-        if record.get("schema_version") == "mcp.envelope.v0.1":
-            record = record.get("provenance", {})
-        issues = validate_methods_in_record(record, strict=args.strict)
-
-    elif args.command == "validate-manifest":
-        manifest = load_json(args.file)
-        issues = validate_capability_manifest(manifest)
-
-    elif args.command == "check-vector":
-        issues = check_test_vector(args.vector_id, expect_fail=getattr(args, "expect_fail", False))
-
-    elif args.command == "list-methods":
-        catalog = load_method_catalog()
-        print(f"prov-spec v{SPEC_VERSION} - Known method IDs:\n")
-        for method in catalog.get("methods", []):
-            status = method.get("status", "unknown")
-            print(f"  [{status:11}] {method['id']}")
-            print(f"               {method.get('summary', '')}")
-        return 0
-
-    elif args.command == "list-vectors":
-        spec_root = find_spec_root()
-        vectors_path = spec_root / "vectors"
-        print(f"prov-spec v{SPEC_VERSION} - Test vectors:\n")
-        if vectors_path.exists():
-            for vector_dir in sorted(vectors_path.iterdir()):
-                if vector_dir.is_dir():
-                    has_positive = (vector_dir / "input.json").exists()
-                    has_negative = (vector_dir / "negative").exists()
-                    markers = []
-                    if has_positive:
-                        markers.append("positive")
-                    if has_negative:
-                        markers.append("negative")
-                    print(f"  {vector_dir.name} ({', '.join(markers)})")
-        return 0
-
-    else:
+    handler = _HANDLERS.get(args.command)
+    if handler is None:
         parser.print_help()
         return 1
 
+    issues = handler(args)
+    if issues is None:
+        return 0
+
     # Print results
     has_errors = False
     for issue in issues:
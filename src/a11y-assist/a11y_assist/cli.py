@@ -10,45 +10,38 @@ Commands:
 
 from __future__ import annotations
 
-import json
 import subprocess
 import sys
-from dataclasses import replace
+from functools import cache
 from pathlib import Path
-from typing import Callable, List, Optional, Set, Tuple
+from sys import intern
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
 
 import click
 
 from . import __version__
-from .from_cli_error import (
-    CliErrorValidationError,
-    assist_from_cli_error,
-    load_cli_error,
-)
-from .guard import GuardViolation, get_guard_context, validate_profile_transform
-from .methods import (
-    METHOD_GUARD_VALIDATE,
-    METHOD_NORMALIZE_RAW_TEXT,
-    METHOD_PROFILE_COGNITIVE_LOAD,
-    METHOD_PROFILE_DYSLEXIA,
-    METHOD_PROFILE_LOWVISION,
-    METHOD_PROFILE_PLAIN_LANGUAGE,
-    METHOD_PROFILE_SCREEN_READER,
-    with_method,
-)
-from .parse_raw import parse_raw
-from .profiles import (
-    apply_cognitive_load,
-    apply_dyslexia,
-    apply_plain_language,
-    apply_screen_reader,
-    render_cognitive_load,
-    render_dyslexia,
-    render_plain_language,
-    render_screen_reader,
-)
-from .render import AssistResult, Confidence, Evidence, render_assist, to_response_dict
-from .storage import read_last_log, write_last_log
+
+# Engine modules (jsonschema, profiles, guard) are imported inside the
+# commands that use them so --help/--version stay cheap.
+if TYPE_CHECKING:
+    from .guard import GuardViolation
+    from .render import AssistResult
+
+
+def _echo_bytes(data: bytes) -> None:
+    """Write pre-encoded output plus a newline directly to stdout.
+
+    Bypasses click.echo's per-call text processing for large JSON payloads.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        click.echo(data.decode("utf-8"))
+        return
+    # Keep ordering with anything already written through the text layer
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.write(b"\n")
+    buffer.flush()
 
 
 def output_result(
@@ -65,59 +58,101 @@ def output_result(
         json_response: If True, print JSON instead of rendered text
         json_out: If set, write JSON to this path (in addition to rendered output)
     """
+    from .jsonio import dumps_pretty_bytes
+    from .render import to_response_dict
+
+    # Serialize once; stdout and --json-out share the same bytes
+    payload: Optional[bytes] = None
+    if json_response or json_out:
+        payload = dumps_pretty_bytes(to_response_dict(result))
+
     if json_response:
         # JSON to stdout instead of rendered text
-        click.echo(json.dumps(to_response_dict(result), indent=2))
+        _echo_bytes(payload)
     else:
         # Rendered text to stdout (default)
         click.echo(rendered, nl=False)
 
     # Write JSON to file if requested (regardless of json_response)
     if json_out:
-        Path(json_out).write_text(
-            json.dumps(to_response_dict(result), indent=2),
-            encoding="utf-8",
-        )
+        Path(json_out).write_bytes(payload)
+
 
 # Profile registry
 PROFILE_CHOICES = [
-    "lowvision",
-    "cognitive-load",
-    "screen-reader",
-    "dyslexia",
-    "plain-language",
+    intern(name)
+    for name in (
+        "lowvision",
+        "cognitive-load",
+        "screen-reader",
+        "dyslexia",
+        "plain-language",
+    )
 ]
 
+# Shared Click parameter types (one instance reused across commands)
+_PROFILE_CHOICE = click.Choice(tuple(PROFILE_CHOICES))
+_FORMAT_CHOICE = click.Choice(("text", "json"))
+_MIN_SEVERITY_CHOICE = click.Choice(("info", "warning", "error"))
+_FAIL_ON_CHOICE = click.Choice(("error", "warning", "never"))
+
+# Read size for assist-run's output tee
+ASSIST_RUN_CHUNK_SIZE = 65536
+
+
+# Profile name -> renderer name in .profiles
+_RENDERER_NAMES = {
+    "cognitive-load": "render_cognitive_load",
+    "screen-reader": "render_screen_reader",
+    "dyslexia": "render_dyslexia",
+    "plain-language": "render_plain_language",
+}
+
+# Profile name -> (transform name in .profiles, method ID name in .methods)
+_PROFILE_TRANSFORM_NAMES = {
+    "cognitive-load": ("apply_cognitive_load", "METHOD_PROFILE_COGNITIVE_LOAD"),
+    "screen-reader": ("apply_screen_reader", "METHOD_PROFILE_SCREEN_READER"),
+    "dyslexia": ("apply_dyslexia", "METHOD_PROFILE_DYSLEXIA"),
+    "plain-language": ("apply_plain_language", "METHOD_PROFILE_PLAIN_LANGUAGE"),
+}
+
+
+@cache
+def _profile_transform(
+    profile: str,
+) -> Optional[Tuple[Callable[[AssistResult], AssistResult], str]]:
+    """(transform, method ID) for a profile, importing only that profile."""
+    names = _PROFILE_TRANSFORM_NAMES.get(profile)
+    if names is None:
+        return None
+    from . import methods, profiles
+
+    transform_name, method_name = names
+    return getattr(profiles, transform_name), getattr(methods, method_name)
+
 
 def get_renderer(profile: str) -> Callable[[AssistResult], str]:
     """Get the renderer function for a profile."""
-    if profile == "cognitive-load":
-        return render_cognitive_load
-    if profile == "screen-reader":
-        return render_screen_reader
-    if profile == "dyslexia":
-        return render_dyslexia
-    if profile == "plain-language":
-        return render_plain_language
-    return render_assist
+    name = _RENDERER_NAMES.get(profile)
+    if name is None:
+        from .render import render_assist
+
+        return render_assist
+    from . import profiles
+
+    return getattr(profiles, name)
 
 
 def apply_profile(result: AssistResult, profile: str) -> AssistResult:
     """Apply profile transformation to result and add method ID."""
-    if profile == "cognitive-load":
-        transformed = apply_cognitive_load(result)
-        return with_method(transformed, METHOD_PROFILE_COGNITIVE_LOAD)
-    if profile == "screen-reader":
-        transformed = apply_screen_reader(result)
-        return with_method(transformed, METHOD_PROFILE_SCREEN_READER)
-    if profile == "dyslexia":
-        transformed = apply_dyslexia(result)
-        return with_method(transformed, METHOD_PROFILE_DYSLEXIA)
-    if profile == "plain-language":
-        transformed = apply_plain_language(result)
-        return with_method(transformed, METHOD_PROFILE_PLAIN_LANGUAGE)
-    # Default: lowvision (no transform, just add method)
-    return with_method(result, METHOD_PROFILE_LOWVISION)
+    from .methods import METHOD_PROFILE_LOWVISION, with_method
+
+    entry = _profile_transform(profile)
+    if entry is None:
+        # Default: lowvision (no transform, just add method)
+        return with_method(result, METHOD_PROFILE_LOWVISION)
+    transform, method_id = entry
+    return with_method(transform(result), method_id)
 
 
 def render_with_profile_guarded(
@@ -125,7 +160,8 @@ def render_with_profile_guarded(
     base_result: AssistResult,
     profile: str,
     input_kind: str,
-) -> str:
+    render: bool = True,
+) -> Tuple[str, AssistResult]:
     """Transform and render result according to profile, with guard validation.
 
     Args:
@@ -133,13 +169,18 @@ def render_with_profile_guarded(
         base_result: Base AssistResult before transformation
         profile: Profile name to apply
         input_kind: Type of input (cli_error_json, raw_text, last_log)
+        render: If False, skip rendering and return "" as the text
+            (the guard still runs)
 
     Returns:
-        Rendered output string
+        (rendered output string, transformed result with guard method ID)
 
     Raises:
         GuardViolation: If profile transform violates invariants
     """
+    from .guard import get_guard_context, validate_profile_transform
+    from .methods import METHOD_GUARD_VALIDATE, with_method
+
     # Apply profile transformation (adds profile method ID)
     transformed = apply_profile(base_result, profile)
 
@@ -160,9 +201,36 @@ def render_with_profile_guarded(
     # Add guard method ID after validation passes
     transformed = with_method(transformed, METHOD_GUARD_VALIDATE)
 
+    if not render:
+        return "", transformed
+
     # Render (metadata is not rendered, only stored in result)
     renderer = get_renderer(profile)
-    return renderer(transformed)
+    return renderer(transformed), transformed
+
+
+def _emit_guarded(
+    base_text: str,
+    base_result: AssistResult,
+    profile: str,
+    input_kind: str,
+    json_response: bool,
+    json_out: Optional[str],
+) -> None:
+    """Run the guarded profile pipeline and output the result.
+
+    With --json-response the rendered text is never shown, so rendering is
+    skipped; guard validation always runs.
+    """
+    from .guard import GuardViolation
+
+    try:
+        output, transformed = render_with_profile_guarded(
+            base_text, base_result, profile, input_kind, render=not json_response
+        )
+    except GuardViolation as e:
+        _handle_guard_violation(e)
+    output_result(output, transformed, json_response, json_out)
 
 
 def _handle_guard_violation(e: GuardViolation) -> None:
@@ -201,7 +269,7 @@ def main():
 )
 @click.option(
     "--profile",
-    type=click.Choice(PROFILE_CHOICES),
+    type=_PROFILE_CHOICE,
     default="lowvision",
     help="Accessibility profile (default: lowvision).",
 )
@@ -219,24 +287,21 @@ def main():
 )
 def explain_cmd(json_path: str, profile: str, json_response: bool, json_out: Optional[str]):
     """Explain a structured cli.error.v0.1 JSON message."""
+    from .from_cli_error import (
+        CliErrorValidationError,
+        assist_from_cli_error,
+        load_cli_error_bytes,
+    )
+    from .render import AssistResult
+
     try:
-        obj = load_cli_error(json_path)
+        # Read once: parsed for the assist, decoded for content support checking
+        raw = Path(json_path).read_bytes()
+        obj = load_cli_error_bytes(raw)
         result = assist_from_cli_error(obj)
+        base_text = raw.decode("utf-8", errors="replace")
 
-        # Read the original JSON for content support checking
-        with open(json_path) as f:
-            base_text = f.read()
-
-        try:
-            output = render_with_profile_guarded(
-                base_text, result, profile, "cli_error_json"
-            )
-            # Get the transformed result for JSON output
-            transformed = apply_profile(result, profile)
-            transformed = with_method(transformed, METHOD_GUARD_VALIDATE)
-            output_result(output, transformed, json_response, json_out)
-        except GuardViolation as e:
-            _handle_guard_violation(e)
+        _emit_guarded(base_text, result, profile, "cli_error_json", json_response, json_out)
 
     except CliErrorValidationError as e:
         # Low confidence: we couldn't validate
@@ -254,15 +319,7 @@ def explain_cmd(json_path: str, profile: str, json_response: bool, json_out: Opt
         )
         # For validation errors, base_text is the error message itself
         base_text = "; ".join(e.errors)
-        try:
-            output = render_with_profile_guarded(
-                base_text, res, profile, "cli_error_json"
-            )
-            transformed = apply_profile(res, profile)
-            transformed = with_method(transformed, METHOD_GUARD_VALIDATE)
-            output_result(output, transformed, json_response, json_out)
-        except GuardViolation as ge:
-            _handle_guard_violation(ge)
+        _emit_guarded(base_text, res, profile, "cli_error_json", json_response, json_out)
         raise SystemExit(2)
 
 
@@ -275,7 +332,7 @@ def explain_cmd(json_path: str, profile: str, json_response: bool, json_out: Opt
 )
 @click.option(
     "--profile",
-    type=click.Choice(PROFILE_CHOICES),
+    type=_PROFILE_CHOICE,
     default="lowvision",
     help="Accessibility profile (default: lowvision).",
 )
@@ -293,6 +350,10 @@ def explain_cmd(json_path: str, profile: str, json_response: bool, json_out: Opt
 )
 def triage_cmd(use_stdin: bool, profile: str, json_response: bool, json_out: Optional[str]):
     """Triage raw CLI output (best effort)."""
+    from .methods import METHOD_NORMALIZE_RAW_TEXT
+    from .parse_raw import parse_raw
+    from .render import AssistResult, Confidence, Evidence
+
     if not use_stdin:
         click.echo("Use: a11y-assist triage --stdin", err=True)
         raise SystemExit(2)
@@ -308,34 +369,35 @@ def triage_cmd(use_stdin: bool, profile: str, json_response: bool, json_out: Opt
         notes.append("No (ID: ...) found. Emit cli.error.v0.1 for high-confidence assist.")
 
     safest = "Follow the tool's Fix steps, starting with the least risky check."
-    plan: List[str] = []
 
     fix_lines = blocks.get("Fix:", [])
-    if fix_lines:
-        plan = fix_lines[:]
-    else:
-        plan = [
-            "Re-run the command with increased verbosity/logging.",
-            "Update the tool to emit (ID: ...) and What/Why/Fix blocks.",
-            "If this is your tool, adopt cli.error.v0.1 JSON output.",
-        ]
+    plan: Tuple[str, ...] = tuple(fix_lines) or (
+        "Re-run the command with increased verbosity/logging.",
+        "Update the tool to emit (ID: ...) and What/Why/Fix blocks.",
+        "If this is your tool, adopt cli.error.v0.1 JSON output.",
+    )
 
     # Build evidence for raw text
     evidence: List[Evidence] = []
     if fix_lines:
         evidence.append(Evidence(field="safest_next_step", source="raw_text:Fix:1"))
         for i, _ in enumerate(plan):
-            evidence.append(Evidence(field=f"plan[{i}]", source=f"raw_text:Fix:{i+1}"))
+            evidence.append(
+                Evidence(field=intern(f"plan[{i}]"), source=intern(f"raw_text:Fix:{i+1}"))
+            )
 
     safe_cmds = [line for line in plan if "--dry-run" in line][:3]
+    # Map each command back to the first Fix line it appears on
+    plan_index: Dict[str, int] = {}
+    for j, fix_line in enumerate(plan):
+        plan_index.setdefault(fix_line, j)
     for i, cmd in enumerate(safe_cmds):
-        # Find which fix line it came from
-        for j, fix_line in enumerate(plan):
-            if cmd == fix_line:
-                evidence.append(
-                    Evidence(field=f"next_safe_commands[{i}]", source=f"raw_text:Fix:{j+1}")
-                )
-                break
+        evidence.append(
+            Evidence(
+                field=intern(f"next_safe_commands[{i}]"),
+                source=intern(f"raw_text:Fix:{plan_index[cmd]+1}"),
+            )
+        )
 
     res = AssistResult(
         anchored_id=err_id,
@@ -348,19 +410,13 @@ def triage_cmd(use_stdin: bool, profile: str, json_response: bool, json_out: Opt
         evidence=tuple(evidence),
     )
 
-    try:
-        output = render_with_profile_guarded(text, res, profile, "raw_text")
-        transformed = apply_profile(res, profile)
-        transformed = with_method(transformed, METHOD_GUARD_VALIDATE)
-        output_result(output, transformed, json_response, json_out)
-    except GuardViolation as e:
-        _handle_guard_violation(e)
+    _emit_guarded(text, res, profile, "raw_text", json_response, json_out)
 
 
 @main.command("last")
 @click.option(
     "--profile",
-    type=click.Choice(PROFILE_CHOICES),
+    type=_PROFILE_CHOICE,
     default="lowvision",
     help="Accessibility profile (default: lowvision).",
 )
@@ -378,6 +434,11 @@ def triage_cmd(use_stdin: bool, profile: str, json_response: bool, json_out: Opt
 )
 def last_cmd(profile: str, json_response: bool, json_out: Optional[str]):
     """Assist using the last captured log (~/.a11y-assist/last.log)."""
+    from .methods import METHOD_NORMALIZE_RAW_TEXT
+    from .parse_raw import parse_raw
+    from .render import AssistResult, Confidence, Evidence
+    from .storage import read_last_log
+
     text = read_last_log()
     if not text.strip():
         res = AssistResult(
@@ -390,13 +451,7 @@ def last_cmd(profile: str, json_response: bool, json_out: Optional[str]):
         )
         # For empty last log, use the error message as base text
         base_text = "No last.log found. Run assist-run command."
-        try:
-            output = render_with_profile_guarded(base_text, res, profile, "last_log")
-            transformed = apply_profile(res, profile)
-            transformed = with_method(transformed, METHOD_GUARD_VALIDATE)
-            output_result(output, transformed, json_response, json_out)
-        except GuardViolation as e:
-            _handle_guard_violation(e)
+        _emit_guarded(base_text, res, profile, "last_log", json_response, json_out)
         raise SystemExit(2)
 
     err_id, status, blocks = parse_raw(text)
@@ -404,26 +459,32 @@ def last_cmd(profile: str, json_response: bool, json_out: Optional[str]):
     notes: List[str] = [] if err_id else ["No (ID: ...) found in last.log."]
 
     fix_lines = blocks.get("Fix:", [])
-    plan: List[str] = fix_lines or [
+    plan: Tuple[str, ...] = tuple(fix_lines) or (
         "Re-run with verbosity.",
         "Adopt cli.error.v0.1 output for high-confidence assistance.",
-    ]
+    )
 
     # Build evidence for last.log (same as raw_text)
     evidence: List[Evidence] = []
     if fix_lines:
         evidence.append(Evidence(field="safest_next_step", source="raw_text:Fix:1"))
         for i, _ in enumerate(plan):
-            evidence.append(Evidence(field=f"plan[{i}]", source=f"raw_text:Fix:{i+1}"))
+            evidence.append(
+                Evidence(field=intern(f"plan[{i}]"), source=intern(f"raw_text:Fix:{i+1}"))
+            )
 
     safe_cmds = [line for line in plan if "--dry-run" in line][:3]
+    # Map each command back to the first Fix line it appears on
+    plan_index: Dict[str, int] = {}
+    for j, fix_line in enumerate(plan):
+        plan_index.setdefault(fix_line, j)
     for i, cmd in enumerate(safe_cmds):
-        for j, fix_line in enumerate(plan):
-            if cmd == fix_line:
-                evidence.append(
-                    Evidence(field=f"next_safe_commands[{i}]", source=f"raw_text:Fix:{j+1}")
-                )
-                break
+        evidence.append(
+            Evidence(
+                field=intern(f"next_safe_commands[{i}]"),
+                source=intern(f"raw_text:Fix:{plan_index[cmd]+1}"),
+            )
+        )
 
     res = AssistResult(
         anchored_id=err_id,
@@ -436,13 +497,7 @@ def last_cmd(profile: str, json_response: bool, json_out: Optional[str]):
         evidence=tuple(evidence),
     )
 
-    try:
-        output = render_with_profile_guarded(text, res, profile, "last_log")
-        transformed = apply_profile(res, profile)
-        transformed = with_method(transformed, METHOD_GUARD_VALIDATE)
-        output_result(output, transformed, json_response, json_out)
-    except GuardViolation as e:
-        _handle_guard_violation(e)
+    _emit_guarded(text, res, profile, "last_log", json_response, json_out)
 
 
 def assist_run():
@@ -450,26 +505,32 @@ def assist_run():
 
     Usage: assist-run <cmd> [args...]
     """
+    from .storage import open_last_log
+
     if len(sys.argv) < 2:
         print("Usage: assist-run <command> [args...]", file=sys.stderr)
         raise SystemExit(2)
 
     cmd = sys.argv[1:]
-    proc = subprocess.run(
-        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0
     )
-    output = proc.stdout or ""
-
-    # Print original output unchanged
-    sys.stdout.write(output)
-
-    # Save for a11y-assist last
-    write_last_log(output)
 
-    if proc.returncode != 0:
+    # Tee raw output chunks to the terminal (unchanged) and to last.log
+    # for a11y-assist last, without holding the whole output in memory.
+    out = sys.stdout.buffer
+    with open_last_log() as log:
+        while chunk := proc.stdout.read(ASSIST_RUN_CHUNK_SIZE):
+            out.write(chunk)
+            out.flush()
+            log.write(chunk)
+    proc.stdout.close()
+    returncode = proc.wait()
+
+    if returncode != 0:
         print("\nTip: run `a11y-assist last` for help", file=sys.stderr)
 
-    raise SystemExit(proc.returncode)
+    raise SystemExit(returncode)
 
 
 @main.command("ingest")
@@ -486,13 +547,13 @@ def assist_run():
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["text", "json"]),
+    type=_FORMAT_CHOICE,
     default="text",
     help="Output format for stdout (default: text).",
 )
 @click.option(
     "--min-severity",
-    type=click.Choice(["info", "warning", "error"]),
+    type=_MIN_SEVERITY_CHOICE,
     default="info",
     help="Minimum severity to include (default: info).",
 )
@@ -508,7 +569,7 @@ def assist_run():
 )
 @click.option(
     "--fail-on",
-    type=click.Choice(["error", "warning", "never"]),
+    type=_FAIL_ON_CHOICE,
     default="error",
     help="Exit nonzero if findings exist at/above this severity (default: error).",
 )
@@ -534,6 +595,7 @@ def ingest_cmd(
         write_advisories,
         write_ingest_summary,
     )
+    from .jsonio import dumps_pretty_bytes
 
     findings = Path(findings_path)
 
@@ -579,7 +641,7 @@ def ingest_cmd(
         }
         if verify_provenance or strict:
             summary["provenance_verified"] = result.provenance_verified
-        click.echo(json.dumps(summary, indent=2))
+        _echo_bytes(dumps_pretty_bytes(summary))
     else:
         click.echo(render_text_summary(result))
         click.echo(f"\nOutput: {out}")
@@ -5,25 +5,72 @@ High-confidence path: validated JSON with ID, What, Why, Fix.
 
 from __future__ import annotations
 
-import json
+import re
+from functools import cache
 from importlib import resources
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
-
-from jsonschema import Draft202012Validator
+from sys import intern
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
+from . import jsonio
 from .methods import METHOD_NORMALIZE_CLI_ERROR, evidence_for_plan
 from .render import AssistResult, Evidence
 
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
+
 
 def _load_schema(name: str) -> Dict[str, Any]:
     """Load a JSON schema from the schemas package."""
-    with resources.files("a11y_assist.schemas").joinpath(name).open("rb") as f:
-        return json.load(f)
+    return jsonio.loads(resources.files("a11y_assist.schemas").joinpath(name).read_bytes())
+
+
+@cache
+def _cli_error_validator() -> "Draft202012Validator":
+    """Build the cli.error.v0.1 validator on first use.
+
+    jsonschema dominates import time, so it is only loaded when a
+    cli.error JSON file is actually validated (not for --help/--version).
+    """
+    from jsonschema import Draft202012Validator
+
+    return Draft202012Validator(_load_schema("cli.error.schema.v0.1.json"))
+
+
+@cache
+def _cli_error_fast_check() -> Optional[Callable[[Any], Any]]:
+    """Compile a code-generated validator if fastjsonschema is installed.
+
+    Used only to accept valid documents quickly; invalid ones are re-checked
+    with jsonschema so error messages stay the same. The cli.error schema
+    only uses keywords whose meaning is unchanged since draft-07, which is
+    what fastjsonschema implements.
+    """
+    try:
+        import fastjsonschema
+    except ImportError:
+        return None
+    return fastjsonschema.compile(_load_schema("cli.error.schema.v0.1.json"))
+
+
+# Fix lines that carry a command: explicit dry-run or a shell-style prefix
+_COMMAND_LINE_RE = re.compile(r"--dry-run|^\s*(?:\$ |> |run )")
 
+# "Re-run: <cmd>" lines (case-insensitive prefix)
+_RERUN_RE = re.compile(r"re-run:(.*)", re.IGNORECASE | re.DOTALL)
 
-_CLI_ERROR_SCHEMA = _load_schema("cli.error.schema.v0.1.json")
-_CLI_ERROR_VALIDATOR = Draft202012Validator(_CLI_ERROR_SCHEMA)
+# Commands considered SAFE (non-destructive) by heuristic
+_SAFE_COMMAND_RE = re.compile(r"--dry-run|validate|check")
+
+# SAFE commands surfaced per assist
+MAX_SAFE_COMMANDS = 3
+
+# Prompt characters stripped from command lines
+_PROMPT_CHARS = str.maketrans("", "", "$>")
+
+# Validation errors collected per document (callers display the first 5)
+MAX_REPORTED_ERRORS = 6
 
 
 class CliErrorValidationError(Exception):
@@ -36,14 +83,35 @@ class CliErrorValidationError(Exception):
 
 def load_cli_error(path: str) -> Dict[str, Any]:
     """Load and validate a cli.error.v0.1 JSON file."""
-    obj = json.loads(Path(path).read_text(encoding="utf-8"))
+    return load_cli_error_bytes(Path(path).read_bytes())
+
+
+def load_cli_error_bytes(data: bytes) -> Dict[str, Any]:
+    """Parse and validate cli.error.v0.1 JSON from raw bytes.
+
+    Lets callers that also need the original text read the file once.
+    """
+    obj = jsonio.loads(data)
+
+    fast_check = _cli_error_fast_check()
+    if fast_check is not None:
+        try:
+            fast_check(obj)
+            return obj
+        except ValueError:
+            # JsonSchemaException; fall through for the full error report
+            pass
+
+    # Only the first few errors are ever shown, so stop walking early.
+    collected = list(islice(_cli_error_validator().iter_errors(obj), MAX_REPORTED_ERRORS))
+    if not collected:
+        return obj
+    collected.sort(key=lambda x: tuple(x.path))
     errs: List[str] = []
-    for e in sorted(_CLI_ERROR_VALIDATOR.iter_errors(obj), key=lambda x: x.path):
+    for e in collected:
         loc = ".".join([str(p) for p in e.path]) or "(root)"
         errs.append(f"{loc}: {e.message}")
-    if errs:
-        raise CliErrorValidationError(errs)
-    return obj
+    raise CliErrorValidationError(errs)
 
 
 def _normalize_to_list(value: Any) -> List[str]:
@@ -74,14 +142,10 @@ def assist_from_cli_error(obj: Dict[str, Any]) -> AssistResult:
     why = _normalize_to_list(obj.get("why"))
     fix = _normalize_to_list(obj.get("fix"))
 
-    # Build plan from Fix lines
-    plan: List[str] = []
-    for line in fix:
-        if isinstance(line, str) and line.strip():
-            plan.append(line.strip())
-
-    if not plan:
-        plan = ["Follow the Fix steps provided by the tool output."]
+    # Build plan from Fix lines (a tuple, handed to AssistResult as-is)
+    plan: Tuple[str, ...] = tuple(
+        line.strip() for line in fix if isinstance(line, str) and line.strip()
+    ) or ("Follow the Fix steps provided by the tool output.",)
 
     safest_next = "Follow the Fix steps in order, starting with the least risky check."
     if why and isinstance(why[0], str) and why[0].strip():
@@ -93,57 +157,67 @@ def assist_from_cli_error(obj: Dict[str, Any]) -> AssistResult:
     # SAFE commands: only include clearly non-destructive suggestions from fix text.
     # v0.1 is conservative: we only surface commands already present (not invented).
     next_cmds: List[str] = []
-    for line in fix:
+    cmd_source: Dict[str, int] = {}  # command -> first fix line it came from
+    for j, line in enumerate(fix):
         if isinstance(line, str):
             # Accept explicit dry-run or command prefixes
-            if "--dry-run" in line or line.strip().startswith(("$ ", "> ", "run ")):
-                next_cmds.append(line.replace("$", "").replace(">", "").strip())
+            if _COMMAND_LINE_RE.search(line):
+                cmd = line.translate(_PROMPT_CHARS).strip()
+                next_cmds.append(cmd)
+                cmd_source.setdefault(cmd, j)
             # Accept "Re-run: <cmd>" style
-            if line.lower().startswith("re-run:"):
-                next_cmds.append(line.split(":", 1)[1].strip())
+            m = _RERUN_RE.match(line)
+            if m:
+                cmd = m.group(1).strip()
+                next_cmds.append(cmd)
+                cmd_source.setdefault(cmd, j)
 
     # Filter to SAFE-only heuristically
-    safe_filtered = [
-        c for c in next_cmds if "--dry-run" in c or "validate" in c or "check" in c
-    ]
-    safe_filtered = list(dict.fromkeys(safe_filtered))  # dedupe preserving order
+    # Filter, dedupe (preserving order) and cap in one pass
+    safe_filtered: List[str] = []
+    seen: Set[str] = set()
+    for c in next_cmds:
+        if c not in seen and _SAFE_COMMAND_RE.search(c):
+            seen.add(c)
+            safe_filtered.append(c)
+            if len(safe_filtered) == MAX_SAFE_COMMANDS:
+                break
 
     notes = [
         f"Original title: {title}",
         "This assist block is additive; it does not replace the tool's output.",
     ]
 
-    # Build evidence anchors for traceability
-    evidence: List[Evidence] = []
-
-    # Evidence for safest_next_step
-    if why:
-        evidence.append(Evidence(field="safest_next_step", source="cli.error.why[0]"))
-    else:
-        evidence.append(Evidence(field="safest_next_step", source="cli.error.fix[0]"))
-
-    # Evidence for plan steps (map to fix lines)
-    evidence.extend(evidence_for_plan(plan, source_prefix="cli.error.fix"))
-
-    # Evidence for safe commands (track which fix line they came from)
-    for i, cmd in enumerate(safe_filtered[:3]):
-        # Find the original fix line index
-        for j, fix_line in enumerate(fix):
-            if cmd in fix_line or (
-                fix_line.lower().startswith("re-run:") and cmd == fix_line.split(":", 1)[1].strip()
-            ):
-                evidence.append(
-                    Evidence(field=f"next_safe_commands[{i}]", source=f"cli.error.fix[{j}]")
+    # Build evidence anchors for traceability in a single pass:
+    # safest_next_step, then plan steps (map to fix lines), then safe
+    # commands (track which fix line they came from).
+    evidence = tuple(
+        chain(
+            (
+                Evidence(
+                    field="safest_next_step",
+                    source="cli.error.why[0]" if why else "cli.error.fix[0]",
+                ),
+            ),
+            evidence_for_plan(plan, source_prefix="cli.error.fix"),
+            (
+                Evidence(
+                    field=intern(f"next_safe_commands[{i}]"),
+                    source=intern(f"cli.error.fix[{cmd_source[cmd]}]"),
                 )
-                break
+                for i, cmd in enumerate(safe_filtered)
+                if cmd in cmd_source
+            ),
+        )
+    )
 
     return AssistResult(
         anchored_id=err_id if isinstance(err_id, str) else None,
         confidence="High",
         safest_next_step=safest_next,
         plan=plan,
-        next_safe_commands=safe_filtered[:3],
+        next_safe_commands=safe_filtered,
         notes=notes,
         methods_applied=(METHOD_NORMALIZE_CLI_ERROR,),
-        evidence=tuple(evidence),
+        evidence=evidence,
     )
@@ -16,7 +16,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Literal, Optional, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterator, List, Literal, Optional, Set, Tuple
 
 from .render import AssistResult, Confidence
 
@@ -48,19 +49,31 @@ GLUE_VOCABULARY = frozenset([
     "line", "cli", "json", "order", "instructions", "steps",
 ])
 
+# Content tokenization: ASCII translate table (upper -> lower, everything
+# that is not [a-z0-9] -> space) and the equivalent regex for other text
+_TOKEN_TRANS = str.maketrans({
+    c: (chr(c).lower() if chr(c).isalnum() else " ") for c in range(128)
+})
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9]+", re.ASCII)
+
 # Visual navigation patterns
 VISUAL_NAV_PATTERNS = re.compile(
     r"\b(see\s+)?(above|below|left|right|arrow)\b", re.IGNORECASE
 )
 
-# Parenthetical pattern
-PARENTHETICAL_PATTERN = re.compile(r"[\(\)\[\]]")
+# Parenthetical characters (a set test is cheaper than a regex search)
+PARENTHETICAL_CHARS = frozenset("()[]")
+
+# Separator used to scan all text fields in one call. Newline is not a
+# word character, so \b boundaries behave as they would per field.
+_FIELD_SEP = "\n"
 
 # Confidence ordering (lower index = lower confidence)
 CONFIDENCE_ORDER = {"Low": 0, "Medium": 1, "High": 2}
+_confidence_level = CONFIDENCE_ORDER.get
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GuardIssue:
     """A single guard violation."""
 
@@ -78,22 +91,24 @@ class GuardViolation(Exception):
         self.issues = issues
 
     def __str__(self) -> str:
-        lines = ["Profile guard violation:"]
+        return "\n".join(self._lines())
+
+    def _lines(self) -> Iterator[str]:
+        yield "Profile guard violation:"
         for issue in self.issues:
-            lines.append(f"  [{issue.severity}] {issue.code}: {issue.message}")
+            yield f"  [{issue.severity}] {issue.code}: {issue.message}"
             for k, v in issue.details.items():
-                lines.append(f"    {k}: {v}")
-        return "\n".join(lines)
+                yield f"    {k}: {v}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GuardContext:
     """Context for guard validation."""
 
     profile: str  # e.g. "screen-reader"
     confidence: Confidence  # High/Medium/Low
     input_kind: str  # cli_error_json|raw_text|scorecard_json|last_log
-    allowed_safe_commands: frozenset[str]  # derived from base inputs verbatim
+    allowed_safe_commands: frozenset[str]  # from base inputs; "$ " stripped on init
 
     # Per-profile constraints
     forbid_parentheticals: bool = False
@@ -101,25 +116,56 @@ class GuardContext:
     max_steps: Optional[int] = None  # enforce if set
     allow_commands_on_low: bool = False  # default: no commands on Low confidence
 
+    def __post_init__(self) -> None:
+        # Normalize once so command checks are a plain set lookup
+        object.__setattr__(
+            self,
+            "allowed_safe_commands",
+            frozenset(_normalize_command(c) for c in self.allowed_safe_commands),
+        )
+
+
+def _normalize_command(cmd: str) -> str:
+    """Normalize a command for comparison (strip $ prefix)."""
+    return cmd.lstrip("$ ").strip()
 
-def _tokenize_content(text: str) -> Set[str]:
+
+@lru_cache(maxsize=1024)
+def _tokenize_content(text: str) -> FrozenSet[str]:
     """Tokenize text into lowercase content words.
 
     - Letters/numbers only
     - Strip punctuation
     - Drop stopwords
     - Drop tokens < 3 chars
+
+    Memoized: the same plan steps and base text recur across profiles.
     """
-    # Extract alphanumeric tokens
-    tokens = re.findall(r"[a-zA-Z0-9]+", text.lower())
+    if text.isascii():
+        # One C-level pass lowercases and blanks out punctuation
+        tokens = text.translate(_TOKEN_TRANS).split()
+    else:
+        # lower() can map non-ASCII letters to ASCII; keep the regex path
+        tokens = _TOKEN_RE.findall(text.lower())
     # Filter
-    return {
+    return frozenset(
         t for t in tokens
         if len(t) >= 3 and t not in STOPWORDS
-    }
+    )
 
 
-def _is_content_supported(line: str, base_tokens: Set[str]) -> bool:
+@lru_cache(maxsize=128)
+def _base_tokens_cached(base_text: str) -> FrozenSet[str]:
+    """Tokenize a guard base text, memoized separately from plan steps.
+
+    The same base text is validated once per profile rendered from it;
+    keeping these (often long) strings in their own small cache stops them
+    from evicting the many short step strings in _tokenize_content's.
+    """
+    return _tokenize_content.__wrapped__(base_text)
+
+
+def _is_content_supported(line: str, base_tokens: FrozenSet[str]) -> bool:
     """Check if a line is supported by base text content.
 
     A line is supported if:
@@ -132,19 +178,16 @@ def _is_content_supported(line: str, base_tokens: Set[str]) -> bool:
         # Empty line or all stopwords/short words - allowed
         return True
 
-    # Check for overlap with base
-    overlap = line_tokens & base_tokens
-    if overlap:
+    # Check for overlap with base (the common case)
+    if not line_tokens.isdisjoint(base_tokens):
         return True
 
-    # Check if all tokens are glue vocabulary
-    non_glue = line_tokens - GLUE_VOCABULARY
-    if not non_glue:
-        return True
-
-    # Check if non-glue tokens are in base
-    unsupported = non_glue - base_tokens
-    return len(unsupported) == 0
+    # Otherwise every token must be glue vocabulary or base content;
+    # stop at the first one that is neither
+    for t in line_tokens:
+        if t not in GLUE_VOCABULARY and t not in base_tokens:
+            return False
+    return True
 
 
 def _check_id_invariant(
@@ -179,10 +222,8 @@ def _check_confidence_invariant(
     base: AssistResult, profiled: AssistResult, issues: List[GuardIssue]
 ) -> None:
     """Check: Confidence cannot increase."""
-    base_level = CONFIDENCE_ORDER.get(base.confidence, 0)
-    profiled_level = CONFIDENCE_ORDER.get(profiled.confidence, 0)
-
-    if profiled_level > base_level:
+    base_level = _confidence_level(base.confidence, 0)
+    if _confidence_level(profiled.confidence, 0) > base_level:
         issues.append(GuardIssue(
             severity="ERROR",
             code="A11Y.ASSIST.GUARD.CONFIDENCE.INCREASED",
@@ -203,18 +244,8 @@ def _check_commands_invariant(
     """Check: SAFE-only commands - no new commands, no risky."""
     # Check each profiled command
     for cmd in profiled.next_safe_commands:
-        # Normalize for comparison (strip $ prefix)
-        normalized_cmd = cmd.lstrip("$ ").strip()
-
         # Check if command is in allowed set
-        allowed = False
-        for allowed_cmd in ctx.allowed_safe_commands:
-            normalized_allowed = allowed_cmd.lstrip("$ ").strip()
-            if normalized_cmd == normalized_allowed:
-                allowed = True
-                break
-
-        if not allowed:
+        if _normalize_command(cmd) not in ctx.allowed_safe_commands:
             issues.append(GuardIssue(
                 severity="ERROR",
                 code="A11Y.ASSIST.GUARD.COMMANDS.INVENTED",
@@ -255,42 +286,8 @@ def _check_step_count_invariant(
             ))
 
 
-def _check_content_support_invariant(
-    base_text: str,
-    profiled: AssistResult,
-    issues: List[GuardIssue],
-) -> None:
-    """Check: Profile must not add new factual content."""
-    base_tokens = _tokenize_content(base_text)
-
-    # Check safest_next_step
-    if not _is_content_supported(profiled.safest_next_step, base_tokens):
-        issues.append(GuardIssue(
-            severity="WARN",
-            code="A11Y.ASSIST.GUARD.CONTENT.UNSUPPORTED",
-            message="Safest next step contains content not found in base text",
-            details={
-                "text": profiled.safest_next_step[:80],
-            },
-        ))
-
-    # Check plan steps
-    for i, step in enumerate(profiled.plan):
-        if not _is_content_supported(step, base_tokens):
-            issues.append(GuardIssue(
-                severity="WARN",
-                code="A11Y.ASSIST.GUARD.CONTENT.UNSUPPORTED",
-                message=f"Plan step {i + 1} contains content not found in base text",
-                details={
-                    "step": step[:80],
-                },
-            ))
-
-
-def _check_parentheticals_constraint(
-    profiled: AssistResult, issues: List[GuardIssue]
-) -> None:
-    """Check: No parentheticals allowed (profile-specific)."""
+def _text_fields(profiled: AssistResult) -> List[Tuple[str, str]]:
+    """Collect (field_name, text) pairs checked by the text constraints."""
     fields_to_check = [
         ("safest_next_step", profiled.safest_next_step),
     ]
@@ -300,10 +297,60 @@ def _check_parentheticals_constraint(
     fields_to_check.extend(
         (f"notes[{i}]", note) for i, note in enumerate(profiled.notes)
     )
+    return fields_to_check
 
-    for field_name, text in fields_to_check:
-        if PARENTHETICAL_PATTERN.search(text):
-            issues.append(GuardIssue(
+
+def _scan_text_fields(
+    base_text: str,
+    profiled: AssistResult,
+    ctx: GuardContext,
+    issues: List[GuardIssue],
+) -> None:
+    """Check content support and profile text constraints in one pass.
+
+    - Profile must not add new factual content (WARN; safest step and plan)
+    - No parentheticals, if the profile forbids them (ERROR)
+    - No visual navigation references, if the profile forbids them (ERROR)
+
+    Each field is visited once. Issues are appended grouped by check, in
+    the order the checks are listed above.
+    """
+    base_tokens = _base_tokens_cached(base_text)
+    fields_to_check = _text_fields(profiled)
+    content_fields = 1 + len(profiled.plan)  # safest_next_step + plan
+
+    # Fast path: one scan over all fields decides whether any field can hit
+    joined = _FIELD_SEP.join(text for _, text in fields_to_check)
+    check_parens = ctx.forbid_parentheticals and not PARENTHETICAL_CHARS.isdisjoint(joined)
+    check_visual = ctx.forbid_visual_refs and VISUAL_NAV_PATTERNS.search(joined) is not None
+
+    content_issues: List[GuardIssue] = []
+    paren_issues: List[GuardIssue] = []
+    visual_issues: List[GuardIssue] = []
+
+    for n, (field_name, text) in enumerate(fields_to_check):
+        if n < content_fields and not _is_content_supported(text, base_tokens):
+            if n == 0:
+                content_issues.append(GuardIssue(
+                    severity="WARN",
+                    code="A11Y.ASSIST.GUARD.CONTENT.UNSUPPORTED",
+                    message="Safest next step contains content not found in base text",
+                    details={
+                        "text": text[:80],
+                    },
+                ))
+            else:
+                content_issues.append(GuardIssue(
+                    severity="WARN",
+                    code="A11Y.ASSIST.GUARD.CONTENT.UNSUPPORTED",
+                    message=f"Plan step {n} contains content not found in base text",
+                    details={
+                        "step": text[:80],
+                    },
+                ))
+
+        if check_parens and not PARENTHETICAL_CHARS.isdisjoint(text):
+            paren_issues.append(GuardIssue(
                 severity="ERROR",
                 code="A11Y.ASSIST.GUARD.TEXT.PARENTHETICALS_FORBIDDEN",
                 message=f"Parentheticals found in {field_name} (forbidden by profile)",
@@ -313,24 +360,8 @@ def _check_parentheticals_constraint(
                 },
             ))
 
-
-def _check_visual_refs_constraint(
-    profiled: AssistResult, issues: List[GuardIssue]
-) -> None:
-    """Check: No visual navigation references (profile-specific)."""
-    fields_to_check = [
-        ("safest_next_step", profiled.safest_next_step),
-    ]
-    fields_to_check.extend(
-        (f"plan[{i}]", step) for i, step in enumerate(profiled.plan)
-    )
-    fields_to_check.extend(
-        (f"notes[{i}]", note) for i, note in enumerate(profiled.notes)
-    )
-
-    for field_name, text in fields_to_check:
-        if VISUAL_NAV_PATTERNS.search(text):
-            issues.append(GuardIssue(
+        if check_visual and VISUAL_NAV_PATTERNS.search(text):
+            visual_issues.append(GuardIssue(
                 severity="ERROR",
                 code="A11Y.ASSIST.GUARD.TEXT.VISUAL_REFS_FORBIDDEN",
                 message=f"Visual navigation reference found in {field_name} (forbidden by profile)",
@@ -340,6 +371,10 @@ def _check_visual_refs_constraint(
                 },
             ))
 
+    issues.extend(content_issues)
+    issues.extend(paren_issues)
+    issues.extend(visual_issues)
+
 
 def validate_profile_transform(
     base_text: str,
@@ -373,14 +408,8 @@ def validate_profile_transform(
     _check_step_count_invariant(profiled_result, ctx, issues)
 
     # 5. Content support invariant (WARN only)
-    _check_content_support_invariant(base_text, profiled_result, issues)
-
-    # 6. Profile-specific constraints
-    if ctx.forbid_parentheticals:
-        _check_parentheticals_constraint(profiled_result, issues)
-
-    if ctx.forbid_visual_refs:
-        _check_visual_refs_constraint(profiled_result, issues)
+    # 6. Profile-specific constraints (parentheticals, visual refs)
+    _scan_text_fields(base_text, profiled_result, ctx, issues)
 
     # Raise if any ERROR-level issues
     errors = [i for i in issues if i.severity == "ERROR"]
@@ -391,7 +420,21 @@ def validate_profile_transform(
     # (In future, could add a strict mode that fails on WARN too)
 
 
-# Profile rules configuration
+# Profile rules configuration:
+# (forbid_parentheticals, forbid_visual_refs, max_steps, allow_commands_on_low)
+_ProfileRules = Tuple[bool, bool, Optional[int], bool]
+
+_DEFAULT_PROFILE_RULES: _ProfileRules = (False, False, None, False)
+
+_PROFILE_RULES: Dict[str, _ProfileRules] = {
+    "lowvision": (False, False, 5, False),
+    "cognitive-load": (False, False, 3, False),
+    "screen-reader": (True, True, 5, False),  # 3 steps on Low confidence
+    "dyslexia": (True, True, 5, False),
+    "plain-language": (True, False, 4, False),
+}
+
+
 def get_guard_context(
     profile: str,
     confidence: Confidence,
@@ -409,28 +452,12 @@ def get_guard_context(
     Returns:
         GuardContext configured for the profile
     """
-    # Base configuration
-    forbid_parentheticals = False
-    forbid_visual_refs = False
-    max_steps: Optional[int] = None
-    allow_commands_on_low = False
-
-    if profile == "lowvision":
-        max_steps = 5
-    elif profile == "cognitive-load":
-        max_steps = 3
-    elif profile == "screen-reader":
-        forbid_parentheticals = True
-        forbid_visual_refs = True
+    forbid_parentheticals, forbid_visual_refs, max_steps, allow_commands_on_low = (
+        _PROFILE_RULES.get(profile, _DEFAULT_PROFILE_RULES)
+    )
+    if profile == "screen-reader" and confidence == "Low":
         # Screen-reader: 5 steps normally, 3 on Low confidence
-        max_steps = 3 if confidence == "Low" else 5
-    elif profile == "dyslexia":
-        forbid_parentheticals = True
-        forbid_visual_refs = True
-        max_steps = 5
-    elif profile == "plain-language":
-        forbid_parentheticals = True
-        max_steps = 4
+        max_steps = 3
 
     return GuardContext(
         profile=profile,
@@ -8,16 +8,20 @@ Takes findings.json from a11y-evidence-engine and produces:
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from sys import intern
+from types import MappingProxyType
+from typing import Any, DefaultDict, Dict, List, Mapping, Optional, Tuple
 
-from . import __version__
+from . import __version__, jsonio
 
 # Default fix guidance per rule
-DEFAULT_GUIDANCE: Dict[str, Tuple[str, str]] = {
+DEFAULT_GUIDANCE: Mapping[str, Tuple[str, str]] = MappingProxyType({
     "html.document.missing_lang": (
         "Add language attribute to document",
         'Add lang="en" (or correct locale) to the <html> element.',
@@ -34,7 +38,13 @@ DEFAULT_GUIDANCE: Dict[str, Tuple[str, str]] = {
         "Add accessible names to interactive elements",
         "Ensure text content, aria-label, aria-labelledby, or title attribute is present.",
     ),
-}
+})
+
+# Fix guidance for rules without a DEFAULT_GUIDANCE entry
+FALLBACK_FIX = "Review the accessibility issue and apply appropriate fix."
+
+# Slice size used when feeding canonical JSON to the digest
+DIGEST_CHUNK_SIZE = 65536
 
 
 @dataclass
@@ -59,8 +69,7 @@ def load_findings(findings_path: Path) -> Dict[str, Any]:
         raise IngestError(f"Findings file not found: {findings_path}")
 
     try:
-        with open(findings_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = jsonio.loads(findings_path.read_bytes())
     except json.JSONDecodeError as e:
         raise IngestError(f"Invalid JSON in findings file: {e}")
 
@@ -102,10 +111,10 @@ def verify_provenance(
         record_path = base_dir / evidence_ref["record"]
         digest_path = base_dir / evidence_ref["digest"]
 
-        with open(record_path, "r", encoding="utf-8") as f:
-            record = json.load(f)
-        with open(digest_path, "r", encoding="utf-8") as f:
-            digest_record = json.load(f)
+        # Always stdlib json: orjson turns integers wider than 64 bits into
+        # floats, which would change the canonical form and its digest
+        record = json.loads(record_path.read_bytes())
+        digest_record = json.loads(digest_path.read_bytes())
 
         # Extract evidence from record
         prov = record.get("prov.record.v0.1", {})
@@ -130,8 +139,7 @@ def verify_provenance(
             return False, f"{finding.get('finding_id')}: No digest value found"
 
         # Compute actual digest using canonical JSON
-        canonical = canonicalize(evidence)
-        actual_digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        actual_digest = canonical_sha256(evidence)
 
         if actual_digest != expected_digest:
             return (
@@ -146,7 +154,35 @@ def verify_provenance(
 
 
 def canonicalize(value: Any) -> str:
-    """Canonicalize JSON per prov-spec (sorted keys, no whitespace)."""
+    """Canonicalize JSON per prov-spec (sorted keys, no whitespace).
+
+    Values loaded via json.load take the C encoder fast path. Anything it
+    rejects is re-walked by _canonicalize_strict for the precise error.
+    """
+    try:
+        return json.dumps(
+            value, sort_keys=True, separators=(",", ":"), allow_nan=False
+        )
+    except (TypeError, ValueError):
+        return _canonicalize_strict(value)
+
+
+def canonical_sha256(value: Any) -> str:
+    """Hex SHA-256 of canonicalize(value), hashed in bounded slices.
+
+    Canonical output is ASCII, so feeding the hash slice by slice keeps
+    only one small bytes buffer alive next to the canonical string instead
+    of a full encoded copy.
+    """
+    canonical = canonicalize(value)
+    h = hashlib.sha256()
+    for start in range(0, len(canonical), DIGEST_CHUNK_SIZE):
+        h.update(canonical[start:start + DIGEST_CHUNK_SIZE].encode("utf-8"))
+    return h.hexdigest()
+
+
+def _canonicalize_strict(value: Any) -> str:
+    """Recursive canonicalizer that reports non-JSON input precisely."""
     if value is None:
         return "null"
 
@@ -164,12 +200,12 @@ def canonicalize(value: Any) -> str:
         raise ValueError("Non-finite numbers not allowed")
 
     if isinstance(value, list):
-        items = [canonicalize(item) for item in value]
+        items = [_canonicalize_strict(item) for item in value]
         return "[" + ",".join(items) + "]"
 
     if isinstance(value, dict):
         keys = sorted(value.keys())
-        pairs = [json.dumps(k) + ":" + canonicalize(value[k]) for k in keys]
+        pairs = [json.dumps(k) + ":" + _canonicalize_strict(value[k]) for k in keys]
         return "{" + ",".join(pairs) + "}"
 
     raise ValueError(f"Non-JSON value type: {type(value)}")
@@ -177,70 +213,64 @@ def canonicalize(value: Any) -> str:
 
 def group_by_rule(findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Group findings by rule_id with counts."""
-    counts: Dict[str, Dict[str, Any]] = {}
+    counts: Counter[str] = Counter()
+    first_severity: Dict[str, Any] = {}
 
     for finding in findings:
         rule_id = finding.get("rule_id", "unknown")
-        severity = finding.get("severity", "info")
-
-        if rule_id not in counts:
-            counts[rule_id] = {"rule_id": rule_id, "severity": severity, "count": 0}
-        counts[rule_id]["count"] += 1
+        counts[rule_id] += 1
+        if rule_id not in first_severity:
+            first_severity[rule_id] = finding.get("severity", "info")
 
     # Sort by count descending, then rule_id
-    return sorted(counts.values(), key=lambda x: (-x["count"], x["rule_id"]))
+    return [
+        {"rule_id": rule_id, "severity": first_severity[rule_id], "count": count}
+        for rule_id, count in sorted(counts.items(), key=lambda x: (-x[1], x[0]))
+    ]
+
+
+# Slot in group_by_file's per-file [errors, warnings, info] counters;
+# any other severity counts as info
+_FILE_SEVERITY_SLOT = {"error": 0, "warning": 1}
 
 
 def group_by_file(findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Group findings by file with severity counts."""
-    file_counts: Dict[str, Dict[str, int]] = {}
+    file_counts: DefaultDict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
 
     for finding in findings:
         file_path = finding.get("location", {}).get("file", "unknown")
-        severity = finding.get("severity", "info")
-
-        if file_path not in file_counts:
-            file_counts[file_path] = {"errors": 0, "warnings": 0, "info": 0}
-
-        if severity == "error":
-            file_counts[file_path]["errors"] += 1
-        elif severity == "warning":
-            file_counts[file_path]["warnings"] += 1
-        else:
-            file_counts[file_path]["info"] += 1
-
-    # Build result sorted by errors desc, then file name
-    result = [
-        {"file": f, **counts}
-        for f, counts in sorted(
-            file_counts.items(), key=lambda x: (-x[1]["errors"], x[0])
-        )
+        slot = _FILE_SEVERITY_SLOT.get(finding.get("severity", "info"), 2)
+        file_counts[file_path][slot] += 1
+
+    # Top 10 files by errors desc, then file name
+    top = heapq.nsmallest(10, file_counts.items(), key=lambda x: (-x[1][0], x[0]))
+    return [
+        {"file": f, "errors": c[0], "warnings": c[1], "info": c[2]}
+        for f, c in top
     ]
 
-    return result[:10]  # Top 10 files
-
 
 def build_advisories(findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Build advisories grouped by rule with fix guidance."""
-    by_rule: Dict[str, List[Dict[str, Any]]] = {}
+    by_rule: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
 
     for finding in findings:
-        rule_id = finding.get("rule_id", "unknown")
-        if rule_id not in by_rule:
-            by_rule[rule_id] = []
-        by_rule[rule_id].append(finding)
+        by_rule[finding.get("rule_id", "unknown")].append(finding)
 
     advisories = []
-    adv_num = 1
 
-    # Sort rules by count descending for priority
-    for rule_id in sorted(by_rule.keys(), key=lambda r: -len(by_rule[r])):
-        instances = by_rule[rule_id]
+    # Sort rules by count descending for priority (stable: ties keep
+    # first-seen order)
+    ranked = sorted(by_rule.items(), key=lambda x: -len(x[1]))
+    for adv_num, (rule_id, instances) in enumerate(ranked, start=1):
         first = instances[0]
 
-        title, fix = DEFAULT_GUIDANCE.get(
-            rule_id, (f"Fix {rule_id}", "Review the accessibility issue and apply appropriate fix.")
-        )
+        guidance = DEFAULT_GUIDANCE.get(rule_id)
+        if guidance is None:
+            title, fix = f"Fix {rule_id}", FALLBACK_FIX
+        else:
+            title, fix = guidance
 
         advisory = {
             "advisory_id": f"adv-{adv_num:04d}",
@@ -259,7 +289,6 @@ def build_advisories(findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             ],
         }
         advisories.append(advisory)
-        adv_num += 1
 
     return advisories
 
@@ -268,6 +297,7 @@ def ingest(
     findings_path: Path,
     verify_provenance_flag: bool = False,
     min_severity: str = "info",
+    now_iso: Optional[str] = None,
 ) -> IngestResult:
     """Ingest findings from a11y-evidence-engine.
 
@@ -275,13 +305,25 @@ def ingest(
         findings_path: Path to findings.json
         verify_provenance_flag: If True, verify all provenance bundles
         min_severity: Minimum severity to include (info, warning, error)
+        now_iso: ingested_at timestamp to record (default: current UTC time)
 
     Returns:
         IngestResult with summary and advisories
     """
+    if now_iso is None:
+        now_iso = datetime.now(timezone.utc).isoformat()
+
     data = load_findings(findings_path)
     base_dir = findings_path.parent
 
+    # Intern the grouping keys: the same few rule_id/severity strings are
+    # hashed and compared for every finding below
+    for f in data["findings"]:
+        for key in ("rule_id", "severity"):
+            value = f.get(key)
+            if type(value) is str:
+                f[key] = intern(value)
+
     # Filter by severity
     severity_order = {"info": 0, "warning": 1, "error": 2}
     min_level = severity_order.get(min_severity, 0)
@@ -308,7 +350,7 @@ def ingest(
     return IngestResult(
         source_engine=data.get("engine", "unknown"),
         source_version=data.get("version", "unknown"),
-        ingested_at=datetime.now(timezone.utc).isoformat(),
+        ingested_at=now_iso,
         target=data.get("target", {}),
         summary=data.get("summary", {}),
         by_rule=group_by_rule(filtered_findings),
@@ -338,8 +380,7 @@ def write_ingest_summary(result: IngestResult, out_path: Path) -> None:
         summary["provenance_errors"] = result.provenance_errors
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    out_path.write_bytes(jsonio.dumps_pretty_bytes(summary))
 
 
 def write_advisories(result: IngestResult, out_path: Path) -> None:
@@ -357,8 +398,7 @@ def write_advisories(result: IngestResult, out_path: Path) -> None:
     }
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2)
+    out_path.write_bytes(jsonio.dumps_pretty_bytes(output))
 
 
 def render_text_summary(result: IngestResult) -> str:
@@ -0,0 +1,46 @@
+"""JSON encode/decode helpers.
+
+Uses orjson when it is installed (pip install a11y-assist[fast]) and falls
+back to the stdlib json module otherwise. Both paths produce equivalent
+JSON; callers should not depend on which backend is active. Non-ASCII
+text is written as UTF-8 rather than \\uXXXX escapes, matching orjson.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize obj as 2-space indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def dumps_pretty_bytes(obj: Any) -> bytes:
+    """Serialize obj as 2-space indented UTF-8 JSON bytes.
+
+    orjson produces bytes natively, so this avoids a decode/encode round
+    trip when the result is going straight to a file or stdout's buffer.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or text.
+
+    orjson parses bytes directly, so prefer passing Path.read_bytes()
+    output to skip a separate decode pass.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
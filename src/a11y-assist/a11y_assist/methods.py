@@ -1,7 +1,9 @@
 """Methods metadata helpers for audit traceability.
 
 Provides utilities for adding method IDs and evidence anchors
-to AssistResult without modifying core behavior.
+to AssistResult without modifying core behavior. Evidence field/source
+labels are interned (and plan anchors cached): they repeat across every
+result and profile pass.
 
 These are audit-only and do not affect rendering output.
 """
@@ -9,7 +11,9 @@ These are audit-only and do not affect rendering output.
 from __future__ import annotations
 
 from dataclasses import replace
-from typing import List, Sequence
+from functools import lru_cache
+from sys import intern
+from typing import List, Sequence, Tuple
 
 from .render import AssistResult, Evidence
 
@@ -55,13 +59,18 @@ def with_methods(result: AssistResult, methods: Sequence[str]) -> AssistResult:
         methods: Method IDs to add
 
     Returns:
-        New AssistResult with methods added
+        New AssistResult with methods added (result itself if none are new)
     """
-    current = list(result.methods_applied)
+    existing = result.methods_applied
+    seen = set(existing)
+    new = []
     for m in methods:
-        if m not in current:
-            current.append(m)
-    return replace(result, methods_applied=tuple(current))
+        if m not in seen:
+            seen.add(m)
+            new.append(m)
+    if not new:
+        return result
+    return replace(result, methods_applied=existing + tuple(new))
 
 
 def with_evidence(result: AssistResult, evidence: Sequence[Evidence]) -> AssistResult:
@@ -72,11 +81,11 @@ def with_evidence(result: AssistResult, evidence: Sequence[Evidence]) -> AssistR
         evidence: Evidence anchors to add
 
     Returns:
-        New AssistResult with evidence added
+        New AssistResult with evidence added (result itself if evidence is empty)
     """
-    current = list(result.evidence)
-    current.extend(evidence)
-    return replace(result, evidence=tuple(current))
+    if not evidence:
+        return result
+    return replace(result, evidence=result.evidence + tuple(evidence))
 
 
 def with_method(result: AssistResult, method: str) -> AssistResult:
@@ -87,13 +96,15 @@ def with_method(result: AssistResult, method: str) -> AssistResult:
         method: Method ID to add
 
     Returns:
-        New AssistResult with method added
+        New AssistResult with method added (result itself if already present)
     """
-    return with_methods(result, [method])
+    if method in result.methods_applied:
+        return result
+    return replace(result, methods_applied=result.methods_applied + (method,))
 
 
 def evidence_for_plan(
-    plan: List[str],
+    plan: Sequence[str],
     source_prefix: str = "cli.error.fix",
 ) -> List[Evidence]:
     """Generate evidence anchors for plan steps.
@@ -105,10 +116,20 @@ def evidence_for_plan(
     Returns:
         List of Evidence objects mapping plan[i] to source[i]
     """
-    return [
-        Evidence(field=f"plan[{i}]", source=f"{source_prefix}[{i}]")
-        for i in range(len(plan))
-    ]
+    return list(_plan_evidence(source_prefix, len(plan)))
+
+
+@lru_cache(maxsize=64)
+def _plan_evidence(source_prefix: str, count: int) -> Tuple[Evidence, ...]:
+    """Build (and cache) the plan anchors for a prefix and plan length.
+
+    Evidence is frozen, so the same anchors are shared by every result
+    whose plan has this length and source.
+    """
+    return tuple(
+        Evidence(field=intern(f"plan[{i}]"), source=intern(f"{source_prefix}[{i}]"))
+        for i in range(count)
+    )
 
 
 def evidence_for_commands(
@@ -130,8 +151,8 @@ def evidence_for_commands(
     for i, idx in enumerate(source_indices):
         result.append(
             Evidence(
-                field=f"next_safe_commands[{i}]",
-                source=f"{source_prefix}[{idx}]",
+                field=intern(f"next_safe_commands[{i}]"),
+                source=intern(f"{source_prefix}[{idx}]"),
             )
         )
     return result
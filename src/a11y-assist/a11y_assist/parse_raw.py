@@ -6,6 +6,7 @@ Never invents an ID. Confidence is Low/Medium only.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 # Match [OK]/[WARN]/[ERROR] with optional (ID: ...)
@@ -25,13 +26,43 @@ def extract_id(text: str) -> Optional[str]:
 
 def extract_blocks(lines: List[str]) -> Dict[str, List[str]]:
     """Extract What:/Why:/Fix: blocks from lines."""
+    return _scan_lines(lines)[3]
+
+
+def _scan_lines(
+    lines: List[str],
+) -> Tuple[str, Optional[str], bool, Dict[str, List[str]]]:
+    """Single pass over lines collecting status, ID and What/Why/Fix blocks.
+
+    Returns (status, id_or_None, rescan_id, blocks). rescan_id is True when
+    the first "(ID:" doesn't match within its own line: the match may
+    continue onto the next line, so the caller must search the full text.
+    """
     blocks: Dict[str, List[str]] = {"What:": [], "Why:": [], "Fix:": []}
     current: Optional[str] = None
+    status = "UNKNOWN"
+    err_id: Optional[str] = None
+    rescan_id = False
+    id_done = False
 
-    for line in lines:
+    for i, line in enumerate(lines):
         s = line.rstrip("\n")
         stripped = s.strip()
 
+        if i == 0:
+            m = STATUS_RE.match(stripped)
+            if m:
+                status = m.group(1)
+
+        # Cheap substring gate before running the ID regex
+        if not id_done and "(ID:" in line:
+            id_done = True
+            m = ID_IN_PARENS_RE.search(line)
+            if m and m.start() == line.index("(ID:"):
+                err_id = m.group(1)
+            else:
+                rescan_id = True
+
         # Check if this is a block header
         if stripped in blocks:
             current = stripped
@@ -47,25 +78,29 @@ def extract_blocks(lines: List[str]) -> Dict[str, List[str]]:
             # Non-indented lines end the current block
             current = None
 
-    return blocks
+    return status, err_id, rescan_id, blocks
 
 
 def parse_raw(text: str) -> Tuple[Optional[str], str, Dict[str, List[str]]]:
     """Parse raw CLI output.
 
+    Results are memoized per text; callers get fresh block lists each
+    time, so mutating them does not affect later calls.
+
     Returns:
         (error_id or None, status string, blocks dict)
     """
-    lines = text.splitlines()
-    status = "UNKNOWN"
+    err_id, status, blocks = _parse_raw_cached(text)
+    return err_id, status, {name: list(lines) for name, lines in blocks}
 
-    if lines:
-        first_line = lines[0].strip()
-        m = STATUS_RE.match(first_line)
-        if m:
-            status = m.group(1)
 
-    err_id = extract_id(text)
-    blocks = extract_blocks(lines)
+@lru_cache(maxsize=32)
+def _parse_raw_cached(
+    text: str,
+) -> Tuple[Optional[str], str, Tuple[Tuple[str, Tuple[str, ...]], ...]]:
+    """Parse raw CLI output into an immutable (cacheable) form."""
+    status, err_id, rescan_id, blocks = _scan_lines(text.splitlines())
+    if rescan_id:
+        err_id = extract_id(text)
 
-    return err_id, status, blocks
+    return err_id, status, tuple((name, tuple(found)) for name, found in blocks.items())
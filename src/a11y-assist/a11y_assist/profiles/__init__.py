@@ -8,22 +8,34 @@ Profiles transform AssistResult for different accessibility needs:
 - plain-language: Maximum clarity, one clause per sentence, simple structure
 """
 
-from .cognitive_load import apply_cognitive_load
-from .cognitive_load_render import render_cognitive_load
-from .dyslexia import apply_dyslexia
-from .dyslexia_render import render_dyslexia
-from .plain_language import apply_plain_language
-from .plain_language_render import render_plain_language
-from .screen_reader import apply_screen_reader
-from .screen_reader_render import render_screen_reader
-
-__all__ = [
-    "apply_cognitive_load",
-    "render_cognitive_load",
-    "apply_dyslexia",
-    "render_dyslexia",
-    "apply_plain_language",
-    "render_plain_language",
-    "apply_screen_reader",
-    "render_screen_reader",
-]
+from importlib import import_module
+from typing import Any, List
+
+# Exported name -> submodule. Submodules are imported on first attribute
+# access (PEP 562) so a run that uses one profile does not import the others
+# or compile their regexes.
+_LAZY = {
+    "apply_cognitive_load": "cognitive_load",
+    "render_cognitive_load": "cognitive_load_render",
+    "apply_dyslexia": "dyslexia",
+    "render_dyslexia": "dyslexia_render",
+    "apply_plain_language": "plain_language",
+    "render_plain_language": "plain_language_render",
+    "apply_screen_reader": "screen_reader",
+    "render_screen_reader": "screen_reader_render",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
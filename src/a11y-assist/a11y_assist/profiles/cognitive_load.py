@@ -17,22 +17,31 @@ Invariants (non-negotiable):
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import List, Optional
 
 from ..render import AssistResult, Confidence
+from .memo import memoize_transform
 
 # Boilerplate prefixes to strip
 BOILERPLATE_PREFIXES = re.compile(
     r"^(re-?run:\s*|run:\s*|try:\s*|\$\s*|>\s*)", re.IGNORECASE
 )
 
-# Phrases to rewrite to imperative form
-IMPERATIVE_REWRITES = [
-    (re.compile(r"^you should\s+", re.IGNORECASE), "Do "),
-    (re.compile(r"^please\s+", re.IGNORECASE), "Do "),
-    (re.compile(r"^consider\s+", re.IGNORECASE), "Try "),
-    (re.compile(r"^it may help to\s+", re.IGNORECASE), "Try "),
-]
+# First characters (lowercased) that can start a BOILERPLATE_PREFIXES match;
+# IGNORECASE folds no non-ASCII letters onto these
+_BOILERPLATE_FIRST = frozenset("rt$>")
+
+# Phrases to rewrite to imperative form, as one anchored alternation:
+# group 1 -> "Do ", group 2 -> "Try "
+IMPERATIVE_PREFIXES = re.compile(
+    r"^(?:(you should|please)|(consider|it may help to))\s+", re.IGNORECASE
+)
+
+# Raw first characters that can start an IMPERATIVE_PREFIXES match. Both
+# Turkish "İ" and dotless "ı" match "i" under re.IGNORECASE, but "İ".lower()
+# is two characters, so the gate compares the character as-is.
+_IMPERATIVE_FIRST = frozenset("ypciıYPCIİ")
 
 # Conjunction replacements
 CONJUNCTION_REPLACEMENTS = [
@@ -50,24 +59,32 @@ MAX_STEP_LENGTH = 90
 
 def _strip_boilerplate(s: str) -> str:
     """Strip boilerplate prefixes from a string."""
+    if s[:1].lower() not in _BOILERPLATE_FIRST:
+        return s.strip()
     return BOILERPLATE_PREFIXES.sub("", s).strip()
 
 
 def _remove_parentheticals(s: str) -> str:
     """Remove parenthetical content (...) and [...] from string."""
+    if "(" not in s and "[" not in s:
+        # Nothing to remove; same as the path below minus the regex pass
+        return " ".join(s.split()) or s
     result = PARENTHETICAL_RE.sub(" ", s).strip()
     # If removal empties the string, revert
     if not result:
         return s
     # Clean up double spaces
-    return re.sub(r"\s+", " ", result)
+    return " ".join(result.split())
 
 
 def _to_imperative(s: str) -> str:
     """Convert phrases to imperative form."""
-    for pattern, replacement in IMPERATIVE_REWRITES:
-        s = pattern.sub(replacement, s)
-    return s
+    return IMPERATIVE_PREFIXES.sub(_imperative_replacement, s, count=1)
+
+
+def _imperative_replacement(m: re.Match[str]) -> str:
+    """Map an IMPERATIVE_PREFIXES match to its replacement."""
+    return "Do " if m.lastindex == 1 else "Try "
 
 
 def _reduce_conjunctions(s: str) -> str:
@@ -75,14 +92,11 @@ def _reduce_conjunctions(s: str) -> str:
     for old, new in CONJUNCTION_REPLACEMENTS:
         s = s.replace(old, new)
 
-    # Keep only first sentence
-    sentences = s.split(". ")
-    if sentences:
-        first = sentences[0].strip()
-        if first and not first.endswith("."):
-            first += "."
-        return first
-    return s
+    # Keep only first sentence (partition stops at the first separator)
+    first = s.partition(". ")[0].strip()
+    if first and not first.endswith("."):
+        first += "."
+    return first
 
 
 def _cap_length(s: str, max_len: int = MAX_STEP_LENGTH) -> str:
@@ -92,6 +106,7 @@ def _cap_length(s: str, max_len: int = MAX_STEP_LENGTH) -> str:
     return s[: max_len - 1] + "…"
 
 
+@lru_cache(maxsize=4096)
 def normalize_step(step: str) -> str:
     """Normalize a single step according to cognitive-load rules.
 
@@ -106,6 +121,9 @@ def normalize_step(step: str) -> str:
     if not s:
         return s
 
+    # The passes run inline, and the anchored regexes are skipped when the
+    # first character rules out a match.
+
     # 1. Strip boilerplate
     s = _strip_boilerplate(s)
 
@@ -113,17 +131,20 @@ def normalize_step(step: str) -> str:
     s = _remove_parentheticals(s)
 
     # 3. Convert to imperative
-    s = _to_imperative(s)
+    if s[:1] in _IMPERATIVE_FIRST:
+        s = IMPERATIVE_PREFIXES.sub(_imperative_replacement, s, count=1)
 
     # 4. Reduce conjunctions
     s = _reduce_conjunctions(s)
 
     # 5. Cap length
-    s = _cap_length(s)
+    if len(s) > MAX_STEP_LENGTH:
+        s = s[: MAX_STEP_LENGTH - 1] + "…"
 
     return s
 
 
+@lru_cache(maxsize=4096)
 def normalize_safest_step(s: str) -> str:
     """Normalize safest_next_step for cognitive-load.
 
@@ -141,7 +162,7 @@ def normalize_safest_step(s: str) -> str:
     # Split on semicolon or comma, keep first segment
     for sep in [";", ","]:
         if sep in s:
-            s = s.split(sep)[0].strip()
+            s = s.partition(sep)[0].strip()
             break
 
     # Reduce conjunctions to get one sentence
@@ -163,9 +184,16 @@ def reduce_plan(plan: List[str], max_steps: int = 3) -> List[str]:
     if not plan:
         return ["Follow the tool's Fix steps in order."]
 
-    normalized = [normalize_step(s) for s in plan if s.strip()]
-    # Filter out empty results
-    normalized = [s for s in normalized if s]
+    # Normalize only until the cap is reached, dropping empty results
+    normalized = []
+    for s in plan:
+        if not s.strip():
+            continue
+        n = normalize_step(s)
+        if n:
+            normalized.append(n)
+            if len(normalized) == max_steps:
+                break
 
     if not normalized:
         return ["Follow the tool's Fix steps in order."]
@@ -208,6 +236,7 @@ def reduce_notes(notes: List[str], max_notes: int = 2) -> List[str]:
     return reduced
 
 
+@memoize_transform
 def apply_cognitive_load(result: AssistResult) -> AssistResult:
     """Transform AssistResult for cognitive-load profile.
 
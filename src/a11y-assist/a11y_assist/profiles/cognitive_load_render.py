@@ -15,6 +15,10 @@ from ..render import AssistResult
 # Step labels for cognitive-load profile
 STEP_LABELS = ["First", "Next", "Last"]
 
+# Preformatted "  <label>: " prefixes, one per label; zip() against the plan
+# caps rendering at len(STEP_LABELS) steps.
+_STEP_PREFIXES = tuple(f"  {label}: " for label in STEP_LABELS)
+
 
 def render_cognitive_load(result: AssistResult) -> str:
     """Render an AssistResult in cognitive-load format.
@@ -64,9 +68,7 @@ def render_cognitive_load(result: AssistResult) -> str:
 
     # Plan with First/Next/Last labels
     lines.append("Plan:")
-    for i, step in enumerate(result.plan[:3]):
-        label = STEP_LABELS[i] if i < len(STEP_LABELS) else f"Step {i + 1}"
-        lines.append(f"  {label}: {step}")
+    lines.extend(prefix + step for prefix, step in zip(_STEP_PREFIXES, result.plan))
 
     # Next (SAFE) - only show if commands exist
     # Note: cognitive-load transform already filters for confidence
@@ -16,56 +16,103 @@ Max 5 steps. Confidence preserved or downgraded.
 from __future__ import annotations
 
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Set
 
 from ..render import AssistResult
+from .memo import memoize_transform
 
 # Abbreviation expansions (letter-spelled for clarity)
 ABBREVIATIONS = {
-    r"\bCLI\b": "command line",
-    r"\bID\b": "I D",
-    r"\bJSON\b": "J S O N",
-    r"\bAPI\b": "A P I",
-    r"\bSFTP\b": "S F T P",
-    r"\bSSH\b": "S S H",
-    r"\bURL\b": "U R L",
-    r"\bHTTP\b": "H T T P",
-    r"\bHTTPS\b": "H T T P S",
+    "CLI": "command line",
+    "ID": "I D",
+    "JSON": "J S O N",
+    "API": "A P I",
+    "SFTP": "S F T P",
+    "SSH": "S S H",
+    "URL": "U R L",
+    "HTTP": "H T T P",
+    "HTTPS": "H T T P S",
 }
 
+# All abbreviations as one whole-word alternation (one scan per call)
+ABBREVIATION_RE = re.compile(r"\b(?:" + "|".join(ABBREVIATIONS) + r")\b")
+
 # Parenthetical pattern
 PARENTHETICAL = re.compile(r"\s*[\(\[][^\)\]]*[\)\]]\s*")
 
 # Visual reference pattern
 VISUAL_REF = re.compile(r"\b(see\s+)?(above|below|left|right|arrow)\b", re.IGNORECASE)
 
+# Words VISUAL_REF needs, for a cheap pre-check on ASCII text
+_VISUAL_REF_WORDS = ("above", "below", "left", "right", "arrow")
+
 # Symbolic emphasis pattern (*, _, →, emojis)
 SYMBOLIC_EMPHASIS = re.compile(r"[*_→←↑↓]|[\U0001F300-\U0001F9FF]")
 
 
+def _may_have_emphasis(text: str) -> bool:
+    """Cheap pre-check for SYMBOLIC_EMPHASIS (arrows and emoji are non-ASCII)."""
+    return not text.isascii() or "*" in text or "_" in text
+
+
+def _may_have_visual_ref(text: str) -> bool:
+    """Cheap pre-check for VISUAL_REF (non-ASCII text always goes to the regex)."""
+    if not text.isascii():
+        return True
+    lowered = text.lower()
+    return any(word in lowered for word in _VISUAL_REF_WORDS)
+
+
+def _strip_emphasis(text: str) -> str:
+    """Delete SYMBOLIC_EMPHASIS characters without stripping whitespace.
+
+    Arrows and emoji are non-ASCII, so ASCII text only needs the two
+    str.replace calls; the regex is reserved for text that may hold them.
+    """
+    if text.isascii():
+        return text.replace("*", "").replace("_", "")
+    return SYMBOLIC_EMPHASIS.sub("", text)
+
+
 def _expand_abbreviations(text: str) -> str:
-    """Expand abbreviations once for readability."""
-    result = text
-    for pattern, expansion in ABBREVIATIONS.items():
-        result = re.sub(pattern, expansion, result, count=1)
-    return result
+    """Expand abbreviations once for readability.
 
+    Only the first occurrence of each abbreviation is expanded.
+    """
+    seen: Set[str] = set()
+
+    def expand(m: re.Match[str]) -> str:
+        word = m.group(0)
+        if word in seen:
+            return word
+        seen.add(word)
+        return ABBREVIATIONS[word]
 
-def _remove_parentheticals(text: str) -> str:
-    """Remove parenthetical content."""
-    return PARENTHETICAL.sub(" ", text).strip()
+    return ABBREVIATION_RE.sub(expand, text)
 
 
-def _remove_visual_refs(text: str) -> str:
-    """Remove visual navigation references."""
-    return VISUAL_REF.sub("", text).strip()
+def _clean(text: str, visual_refs: bool = True) -> str:
+    """Run the dyslexia text passes in order and collapse whitespace once.
 
+    The passes must stay sequential (removing emphasis can expose a visual
+    reference, e.g. "_above"), but intermediate strip() calls are skipped:
+    the final whitespace collapse makes them redundant.
+    """
+    result = text
+    if "(" in result or "[" in result:
+        result = PARENTHETICAL.sub(" ", result)
+    if visual_refs and _may_have_visual_ref(result):
+        result = VISUAL_REF.sub("", result)
+    if _may_have_emphasis(result):
+        result = _strip_emphasis(result)
+    result = _expand_abbreviations(result)
 
-def _remove_symbolic_emphasis(text: str) -> str:
-    """Remove symbolic emphasis characters."""
-    return SYMBOLIC_EMPHASIS.sub("", text).strip()
+    # Clean up multiple spaces
+    return " ".join(result.split())
 
 
+@lru_cache(maxsize=4096)
 def _normalize_step(step: str) -> str:
     """Normalize a step for dyslexia profile.
 
@@ -75,14 +122,7 @@ def _normalize_step(step: str) -> str:
     - Expand abbreviations
     - Truncate to 110 chars
     """
-    result = step
-    result = _remove_parentheticals(result)
-    result = _remove_visual_refs(result)
-    result = _remove_symbolic_emphasis(result)
-    result = _expand_abbreviations(result)
-
-    # Clean up multiple spaces
-    result = re.sub(r"\s+", " ", result).strip()
+    result = _clean(step)
 
     # Truncate if too long
     if len(result) > 110:
@@ -91,16 +131,13 @@ def _normalize_step(step: str) -> str:
     return result
 
 
+@lru_cache(maxsize=4096)
 def _normalize_safest_step(text: str) -> str:
     """Normalize safest next step."""
-    result = _remove_parentheticals(text)
-    result = _remove_visual_refs(result)
-    result = _remove_symbolic_emphasis(result)
-    result = _expand_abbreviations(result)
-    result = re.sub(r"\s+", " ", result).strip()
-    return result
+    return _clean(text)
 
 
+@memoize_transform
 def apply_dyslexia(result: AssistResult) -> AssistResult:
     """Apply dyslexia profile transformation.
 
@@ -124,10 +161,7 @@ def apply_dyslexia(result: AssistResult) -> AssistResult:
     # Normalize notes (max 2)
     notes: List[str] = []
     for note in result.notes[:2]:  # Max 2 notes
-        normalized = _remove_parentheticals(note)
-        normalized = _remove_symbolic_emphasis(normalized)
-        normalized = _expand_abbreviations(normalized)
-        normalized = re.sub(r"\s+", " ", normalized).strip()
+        normalized = _clean(note, visual_refs=False)
         if normalized:
             notes.append(normalized)
 
@@ -56,8 +56,7 @@ def render_dyslexia(result: AssistResult) -> str:
     # Plan - numbered with "Step N:" prefix
     if result.plan:
         lines.append("Plan:")
-        for i, step in enumerate(result.plan, 1):
-            lines.append(f"  - Step {i}: {step}")
+        lines.extend(f"  - Step {i}: {step}" for i, step in enumerate(result.plan, 1))
         lines.append("")
 
     # Next safe command - only if confidence is not Low
@@ -70,8 +69,7 @@ def render_dyslexia(result: AssistResult) -> str:
     # Notes - max 2, each on its own line
     if result.notes:
         lines.append("Notes:")
-        for note in result.notes[:2]:
-            lines.append(f"  - {note}")
+        lines.extend(f"  - {note}" for note in result.notes[:2])
         lines.append("")
 
     return "\n".join(lines)
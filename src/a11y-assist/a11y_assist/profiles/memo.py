@@ -0,0 +1,59 @@
+"""Memoization for profile transforms.
+
+Profile transforms are pure functions of an AssistResult's content fields
+(they do not carry audit metadata forward), so repeated results - the same
+error recurring in a pipeline - can skip the per-step text passes.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache, wraps
+from typing import Callable, Optional, Tuple
+
+from ..render import AssistResult, Confidence
+
+# Hashable snapshot of the fields a transform reads and writes
+Content = Tuple[Optional[str], Confidence, str, Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]
+
+Transform = Callable[[AssistResult], AssistResult]
+
+
+def _content(result: AssistResult) -> Content:
+    return (
+        result.anchored_id,
+        result.confidence,
+        result.safest_next_step,
+        tuple(result.plan),
+        tuple(result.next_safe_commands),
+        tuple(result.notes),
+    )
+
+
+def _from_content(content: Content) -> AssistResult:
+    anchored_id, confidence, safest_next_step, plan, commands, notes = content
+    return AssistResult(
+        anchored_id=anchored_id,
+        confidence=confidence,
+        safest_next_step=safest_next_step,
+        plan=list(plan),
+        next_safe_commands=list(commands),
+        notes=list(notes),
+    )
+
+
+def memoize_transform(transform: Transform, maxsize: int = 1024) -> Transform:
+    """Cache a profile transform on its input's content fields.
+
+    Cached outputs are stored as tuples and rebuilt with fresh lists on
+    every call, so mutating a returned result does not affect later calls.
+    """
+
+    @lru_cache(maxsize=maxsize)
+    def cached(content: Content) -> Content:
+        return _content(transform(_from_content(content)))
+
+    @wraps(transform)
+    def wrapper(result: AssistResult) -> AssistResult:
+        return _from_content(cached(_content(result)))
+
+    return wrapper
@@ -14,9 +14,11 @@ Max 4 steps. Confidence preserved or downgraded.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import List
 
 from ..render import AssistResult
+from .memo import memoize_transform
 
 # Parenthetical pattern
 PARENTHETICAL = re.compile(r"\s*[\(\[][^\)\]]*[\)\]]\s*")
@@ -33,9 +35,12 @@ SUBORDINATE = re.compile(
 
 def _remove_parentheticals(text: str) -> str:
     """Remove parenthetical content."""
+    if "(" not in text and "[" not in text:
+        return text.strip()
     return PARENTHETICAL.sub(" ", text).strip()
 
 
+@lru_cache(maxsize=4096)
 def _simplify_sentence(text: str) -> str:
     """Simplify a sentence to one clause.
 
@@ -43,18 +48,18 @@ def _simplify_sentence(text: str) -> str:
     - Split on conjunctions, keep first clause
     - Remove subordinate clauses
     """
+    # Stripped here: the clause patterns below are whitespace-sensitive
     result = _remove_parentheticals(text)
 
-    # Split on conjunctions, keep first part
-    parts = CONJUNCTIONS.split(result, maxsplit=1)
-    if parts:
-        result = parts[0].strip()
+    # Split on conjunctions, keep first part (the split consumes the
+    # whitespace before the conjunction, so no strip is needed)
+    result = CONJUNCTIONS.split(result, maxsplit=1)[0]
 
     # Remove subordinate clauses
-    result = SUBORDINATE.sub("", result).strip()
+    result = SUBORDINATE.sub("", result)
 
-    # Clean up trailing punctuation issues
-    result = re.sub(r"\s+", " ", result).strip()
+    # Clean up whitespace (also strips)
+    result = " ".join(result.split())
 
     # Ensure ends with period if it doesn't have punctuation
     if result and not result[-1] in ".!?:":
@@ -63,6 +68,7 @@ def _simplify_sentence(text: str) -> str:
     return result
 
 
+@lru_cache(maxsize=4096)
 def _normalize_step(step: str) -> str:
     """Normalize a step for plain-language profile.
 
@@ -75,11 +81,12 @@ def _normalize_step(step: str) -> str:
     result = _remove_parentheticals(result)
 
     # Clean up
-    result = re.sub(r"\s+", " ", result).strip()
+    result = " ".join(result.split())
 
     return result
 
 
+@memoize_transform
 def apply_plain_language(result: AssistResult) -> AssistResult:
     """Apply plain-language profile transformation.
 
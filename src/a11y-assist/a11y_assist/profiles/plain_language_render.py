@@ -50,8 +50,7 @@ def render_plain_language(result: AssistResult) -> str:
     # Steps - simple numeric list
     if result.plan:
         lines.append("Steps:")
-        for i, step in enumerate(result.plan, 1):
-            lines.append(f"  {i}. {step}")
+        lines.extend(f"  {i}. {step}" for i, step in enumerate(result.plan, 1))
         lines.append("")
 
     # Safe command - only if confidence is not Low
@@ -22,9 +22,11 @@ Screen-reader-specific invariants:
 from __future__ import annotations
 
 import re
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from ..render import AssistResult, Confidence
+from .memo import memoize_transform
 
 # Max step length (audio tolerates longer than visual)
 MAX_STEP_LENGTH = 110
@@ -41,6 +43,10 @@ BOILERPLATE_PREFIXES = re.compile(
     r"^(re-?run:\s*|run:\s*|try:\s*|next:\s*|\$\s*|>\s*)", re.IGNORECASE
 )
 
+# First characters (lowercased) that can start a BOILERPLATE_PREFIXES match;
+# IGNORECASE folds no non-ASCII letters onto these
+_BOILERPLATE_FIRST = frozenset("rtn$>")
+
 # Parenthetical patterns
 PARENTHETICAL_RE = re.compile(r"\s*[\(\[][^\)\]]*[\)\]]\s*")
 
@@ -49,17 +55,29 @@ VISUAL_NAV_PHRASES = re.compile(
     r"\b(see\s+)?(above|below|left|right|arrow)\b", re.IGNORECASE
 )
 
+# Words VISUAL_NAV_PHRASES needs, for a cheap pre-check on ASCII text
+_VISUAL_NAV_WORDS = ("above", "below", "left", "right", "arrow")
+
 # Abbreviation expansions (small, fixed set for determinism)
-ABBREVIATIONS = [
-    (re.compile(r"\bCLI\b"), "command line"),
-    (re.compile(r"\bID\b"), "I D"),
-    (re.compile(r"\bURL\b"), "U R L"),
-    (re.compile(r"\bJSON\b"), "J S O N"),
-    (re.compile(r"\benv\b"), "environment"),
-    (re.compile(r"\bSFTP\b"), "S F T P"),
-    (re.compile(r"\bSSH\b"), "S S H"),
-    (re.compile(r"\bAPI\b"), "A P I"),
-]
+ABBREVIATIONS = {
+    "CLI": "command line",
+    "ID": "I D",
+    "URL": "U R L",
+    "JSON": "J S O N",
+    "env": "environment",
+    "SFTP": "S F T P",
+    "SSH": "S S H",
+    "API": "A P I",
+}
+
+# All abbreviations as one case-sensitive whole-word alternation (one scan
+# per call; expansions never form another abbreviation, so this matches
+# applying them one at a time)
+ABBREVIATION_RE = re.compile(r"\b(?:" + "|".join(ABBREVIATIONS) + r")\b")
+
+# Same alternation without word boundaries: a faster pre-check, since most
+# steps contain none of the abbreviations at all
+_ABBREVIATION_HINT = re.compile("|".join(ABBREVIATIONS))
 
 # Symbol replacements for better TTS
 SYMBOL_REPLACEMENTS = [
@@ -69,74 +87,80 @@ SYMBOL_REPLACEMENTS = [
 ]
 
 
-def _strip_boilerplate(s: str) -> str:
-    """Strip boilerplate prefixes from a string."""
-    return BOILERPLATE_PREFIXES.sub("", s).strip()
+def _may_have_visual_ref(s: str) -> bool:
+    """Cheap pre-check for VISUAL_NAV_PHRASES.
 
+    Non-ASCII text always goes to the regex, since IGNORECASE also folds
+    some non-ASCII letters (e.g. dotless "ı") onto the ASCII words.
+    """
+    if not s.isascii():
+        return True
+    lowered = s.lower()
+    return any(word in lowered for word in _VISUAL_NAV_WORDS)
 
-def _remove_parentheticals(s: str) -> str:
-    """Remove parenthetical content (...) and [...] from string."""
-    result = PARENTHETICAL_RE.sub(" ", s).strip()
-    # If removal empties the string, revert
-    if not result:
-        return s
-    # Clean up double spaces
-    return re.sub(r"\s+", " ", result)
 
+def _strip_boilerplate(s: str) -> str:
+    """Strip boilerplate prefixes from a string."""
+    if s[:1].lower() not in _BOILERPLATE_FIRST:
+        return s.strip()
+    return BOILERPLATE_PREFIXES.sub("", s).strip()
 
-def _remove_visual_references(s: str) -> str:
-    """Remove visual navigation references."""
-    result = VISUAL_NAV_PHRASES.sub("", s)
-    # Clean up double spaces
-    return re.sub(r"\s+", " ", result).strip()
 
+def _abbreviation(m: re.Match[str]) -> str:
+    """Map an ABBREVIATION_RE match to its expansion."""
+    return ABBREVIATIONS[m.group(0)]
 
-def _expand_abbreviations(s: str) -> str:
-    """Expand a small, fixed set of abbreviations for TTS."""
-    for pattern, expansion in ABBREVIATIONS:
-        s = pattern.sub(expansion, s)
-    return s
 
+def _may_have_symbols(s: str) -> bool:
+    """Cheap pre-check for SYMBOL_REPLACEMENTS ("->" and "=>" share ">")."""
+    return ">" in s or " & " in s
 
-def _replace_symbols(s: str) -> str:
-    """Replace symbols that screen readers read awkwardly."""
-    for old, new in SYMBOL_REPLACEMENTS:
-        s = s.replace(old, new)
-    # Clean up double spaces
-    return re.sub(r"\s+", " ", s).strip()
 
+def _tts_clean(s: str) -> str:
+    """Run the parenthetical, visual-reference, abbreviation and symbol passes.
 
-def _one_sentence(s: str) -> str:
-    """Keep only the first sentence/clause."""
-    # Split on semicolon first
+    Whitespace is collapsed once at the end: only the " & " replacement
+    depends on whitespace width, so an earlier collapse is needed only
+    when the text has an "&".
+    """
+    if "(" in s or "[" in s:
+        # If removal empties the string, keep the original
+        s = PARENTHETICAL_RE.sub(" ", s).strip() or s
+    if _may_have_visual_ref(s):
+        s = VISUAL_NAV_PHRASES.sub("", s)
+    if _ABBREVIATION_HINT.search(s):
+        s = ABBREVIATION_RE.sub(_abbreviation, s)
+    if "&" in s:
+        # " & " must only match single spaces
+        s = " ".join(s.split())
+    if _may_have_symbols(s):
+        for old, new in SYMBOL_REPLACEMENTS:
+            s = s.replace(old, new)
+    return " ".join(s.split())
+
+
+def _finalize(s: str, max_len: int) -> str:
+    """Keep the first sentence, ensure a final period and cap the length."""
     if ";" in s:
-        s = s.split(";")[0].strip()
-
-    # Split on comma with multiple clauses (be conservative)
-    # Only split if comma appears to separate independent clauses
-    # For now, keep simple: first sentence only
-    sentences = s.split(". ")
-    if sentences:
-        first = sentences[0].strip()
-        return first
-    return s
-
-
-def _ensure_period(s: str) -> str:
-    """Ensure string ends with a period."""
-    s = s.strip()
+        s = s.partition(";")[0].strip()
+    s = s.partition(". ")[0].strip()
     if s and not s.endswith("."):
         s += "."
-    return s
-
-
-def _cap_length(s: str, max_len: int = MAX_STEP_LENGTH) -> str:
-    """Cap string length, truncating with ellipsis if needed."""
     if len(s) <= max_len:
         return s
     return s[: max_len - 1] + "…"
 
 
+@lru_cache(maxsize=4096)
+def _normalize_core(s: str, max_len: int) -> str:
+    """Shared step/note pipeline: _tts_clean followed by _finalize.
+
+    Cached so repeated notes skip the text passes, as steps already do.
+    """
+    return _finalize(_tts_clean(s), max_len)
+
+
+@lru_cache(maxsize=4096)
 def normalize_step(step: str) -> str:
     """Normalize a single step for screen-reader profile.
 
@@ -157,30 +181,12 @@ def normalize_step(step: str) -> str:
     # 1. Strip boilerplate
     s = _strip_boilerplate(s)
 
-    # 2. Remove parentheticals
-    s = _remove_parentheticals(s)
-
-    # 3. Remove visual navigation references
-    s = _remove_visual_references(s)
-
-    # 4. Expand abbreviations
-    s = _expand_abbreviations(s)
-
-    # 5. Replace symbols
-    s = _replace_symbols(s)
-
-    # 6. One sentence
-    s = _one_sentence(s)
-
-    # 7. Ensure period
-    s = _ensure_period(s)
-
-    # 8. Cap length
-    s = _cap_length(s)
-
-    return s
+    # 2-8. Parentheticals, visual references, abbreviations, symbols,
+    # one sentence, ensure period, cap length
+    return _normalize_core(s, MAX_STEP_LENGTH)
 
 
+@lru_cache(maxsize=4096)
 def normalize_safest_step(s: str) -> str:
     """Normalize safest_next_step for screen-reader profile.
 
@@ -191,25 +197,9 @@ def normalize_safest_step(s: str) -> str:
     if not s:
         return "Follow the steps in order."
 
-    # Remove parentheticals
-    s = _remove_parentheticals(s)
-
-    # Remove visual references
-    s = _remove_visual_references(s)
-
-    # Expand abbreviations
-    s = _expand_abbreviations(s)
-
-    # Replace symbols
-    s = _replace_symbols(s)
-
-    # One sentence
-    s = _one_sentence(s)
-
-    # Ensure period
-    s = _ensure_period(s)
-
-    return _cap_length(s, MAX_STEP_LENGTH)
+    # Remove parentheticals and visual references, expand abbreviations,
+    # replace symbols; one sentence, ensure period, cap length
+    return _normalize_core(s, MAX_STEP_LENGTH)
 
 
 def generate_summary(result: AssistResult) -> str:
@@ -217,19 +207,30 @@ def generate_summary(result: AssistResult) -> str:
 
     Uses available information without inventing facts.
     """
-    # Try to derive from safest_next_step or first plan item
-    if result.notes:
-        # Look for "Original title:" note
-        for note in result.notes:
-            if note.lower().startswith("original title:"):
-                title = note.split(":", 1)[1].strip()
-                if title:
-                    return _ensure_period(_cap_length(title, 80))
+    return _summary(tuple(result.notes), result.confidence)
+
+
+# Note prefix (lowercased) carrying the tool's original error title
+_ORIGINAL_TITLE_PREFIX = "original title:"
+
+
+@lru_cache(maxsize=1024)
+def _summary(notes: Tuple[str, ...], confidence: Confidence) -> str:
+    """Memoized body of generate_summary, keyed on the fields it reads."""
+    # Look for "Original title:" note. Lowercasing never shortens text, so
+    # lowercasing just the prefix-length head of each note is enough.
+    for note in notes:
+        if note[: len(_ORIGINAL_TITLE_PREFIX)].lower().startswith(_ORIGINAL_TITLE_PREFIX):
+            title = note.split(":", 1)[1].strip()
+            if title:
+                if len(title) > 80:
+                    title = title[:79] + "…"
+                return title if title.endswith(".") else title + "."
 
     # Fall back to a generic summary based on confidence
-    if result.confidence == "High":
+    if confidence == "High":
         return "A structured error was detected."
-    elif result.confidence == "Medium":
+    elif confidence == "Medium":
         return "An error was detected with partial information."
     else:
         return "The input did not include a stable error identifier."
@@ -246,9 +247,16 @@ def reduce_plan(plan: List[str], confidence: Confidence) -> List[str]:
 
     max_steps = MAX_STEPS_LOW if confidence == "Low" else MAX_STEPS_DEFAULT
 
-    normalized = [normalize_step(s) for s in plan if s.strip()]
-    # Filter out empty results
-    normalized = [s for s in normalized if s]
+    # Normalize only until the cap is reached, dropping empty results
+    normalized = []
+    for s in plan:
+        if not s.strip():
+            continue
+        n = normalize_step(s)
+        if n:
+            normalized.append(n)
+            if len(normalized) == max_steps:
+                break
 
     if not normalized:
         return ["Follow the tool's instructions."]
@@ -275,10 +283,8 @@ def select_safe_command(
 
     cmd = commands[0]
     # Strip leading $ if present (verbatim but remove the symbol)
-    if cmd.startswith("$ "):
-        cmd = cmd[2:]
-    elif cmd.startswith("$"):
-        cmd = cmd[1:]
+    if cmd[:1] == "$":
+        cmd = cmd[2:] if cmd[1:2] == " " else cmd[1:]
 
     return cmd
 
@@ -296,19 +302,14 @@ def reduce_notes(notes: List[str], max_notes: int = 3) -> List[str]:
 
     reduced = []
     for note in notes[:max_notes]:
-        n = _remove_parentheticals(note)
-        n = _remove_visual_references(n)
-        n = _expand_abbreviations(n)
-        n = _replace_symbols(n)
-        n = _one_sentence(n)
-        n = _ensure_period(n)
-        n = _cap_length(n, MAX_NOTE_LENGTH)
+        n = _normalize_core(note, MAX_NOTE_LENGTH)
         if n and n != ".":
             reduced.append(n)
 
     return reduced
 
 
+@memoize_transform
 def apply_screen_reader(result: AssistResult) -> AssistResult:
     """Transform AssistResult for screen-reader profile.
 
@@ -41,33 +41,24 @@ def render_screen_reader(result: AssistResult) -> str:
         <note>.
         <note>.
     """
-    lines: List[str] = []
-
-    # Header (spoken-friendly)
-    lines.append("ASSIST. Profile: Screen reader.")
-
-    # Anchored ID (spelled out for TTS)
-    if result.anchored_id:
-        lines.append(f"Anchored I D: {result.anchored_id}.")
-    else:
-        lines.append("Anchored I D: none.")
-
-    lines.append(f"Confidence: {result.confidence}.")
-    lines.append("")
-
-    # Summary (one sentence)
-    summary = generate_summary(result)
-    lines.append(f"Summary: {summary}")
-    lines.append("")
-
-    # Safest next step
-    lines.append(f"Safest next step: {result.safest_next_step}")
-    lines.append("")
-
-    # Steps with "Step N:" labels
-    lines.append("Steps:")
-    for i, step in enumerate(result.plan, start=1):
-        lines.append(f"Step {i}: {step}")
+    # Fixed header block as one list literal rather than appends
+    lines: List[str] = [
+        # Header (spoken-friendly)
+        "ASSIST. Profile: Screen reader.",
+        # Anchored ID (spelled out for TTS)
+        f"Anchored I D: {result.anchored_id or 'none'}.",
+        f"Confidence: {result.confidence}.",
+        "",
+        # Summary (one sentence)
+        f"Summary: {generate_summary(result)}",
+        "",
+        # Safest next step
+        f"Safest next step: {result.safest_next_step}",
+        "",
+        # Steps with "Step N:" labels
+        "Steps:",
+    ]
+    lines.extend(f"Step {i}: {step}" for i, step in enumerate(result.plan, start=1))
 
     # Next safe command (only if present)
     if result.next_safe_commands:
@@ -83,7 +74,7 @@ def render_screen_reader(result: AssistResult) -> str:
             lines.append(f"Note: {result.notes[0]}")
         else:
             lines.append("Notes:")
-            for note in result.notes:
-                lines.append(note)
+            lines.extend(result.notes)
 
-    return "\n".join(lines) + "\n"
+    lines.append("")
+    return "\n".join(lines)
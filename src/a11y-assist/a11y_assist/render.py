@@ -6,12 +6,13 @@ Clear labels, spacing, short lines.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Literal, Optional, Tuple
+from itertools import islice
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 
 Confidence = Literal["High", "Medium", "Low"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Evidence:
     """Source anchor for audit traceability.
 
@@ -23,14 +24,14 @@ class Evidence:
     note: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssistResult:
     """Structured assist result with optional audit metadata."""
 
     anchored_id: Optional[str]
     confidence: Confidence
     safest_next_step: str
-    plan: List[str]
+    plan: Sequence[str]  # engines pass tuples; profiles may pass lists
     next_safe_commands: List[str]  # SAFE-only in v0.1
     notes: List[str]
 
@@ -39,6 +40,30 @@ class AssistResult:
     evidence: Tuple[Evidence, ...] = field(default_factory=tuple)
 
 
+def to_response_dict(result: AssistResult) -> Dict[str, Any]:
+    """Convert an AssistResult to an assist.response.v0.1 dict.
+
+    Evidence notes are omitted when unset (the schema allows no nulls there).
+    """
+    evidence: List[Dict[str, str]] = []
+    for e in result.evidence:
+        entry = {"field": e.field, "source": e.source}
+        if e.note is not None:
+            entry["note"] = e.note
+        evidence.append(entry)
+
+    return {
+        "anchored_id": result.anchored_id,
+        "confidence": result.confidence,
+        "safest_next_step": result.safest_next_step,
+        "plan": list(result.plan),
+        "next_safe_commands": list(result.next_safe_commands),
+        "notes": list(result.notes),
+        "methods_applied": list(result.methods_applied),
+        "evidence": evidence,
+    }
+
+
 def render_assist(result: AssistResult) -> str:
     """Render an AssistResult to low-vision-friendly text.
 
@@ -60,36 +85,31 @@ def render_assist(result: AssistResult) -> str:
         Notes:
           - note
     """
-    lines: List[str] = []
-    lines.append("ASSIST (Low Vision):")
-
-    if result.anchored_id:
-        lines.append(f"- Anchored to: {result.anchored_id}")
-    else:
-        lines.append("- Anchored to: (none)")
-
-    lines.append(f"- Confidence: {result.confidence}")
-    lines.append("")
-    lines.append("Safest next step:")
-    lines.append(f"  {result.safest_next_step}")
-    lines.append("")
-
-    lines.append("Plan:")
-    for i, step in enumerate(result.plan[:5], start=1):
-        lines.append(f"  {i}) {step}")
-    if len(result.plan) > 5:
+    lines: List[str] = [
+        "ASSIST (Low Vision):",
+        f"- Anchored to: {result.anchored_id or '(none)'}",
+        f"- Confidence: {result.confidence}",
+        "",
+        "Safest next step:",
+        f"  {result.safest_next_step}",
+        "",
+        "Plan:",
+    ]
+    plan = result.plan
+    lines.extend(f"  {i}) {step}" for i, step in enumerate(islice(plan, 5), start=1))
+    if len(plan) > 5:
         lines.append("  ...")
 
     if result.next_safe_commands:
         lines.append("")
         lines.append("Next (SAFE):")
-        for cmd in result.next_safe_commands[:3]:
-            lines.append(f"  {cmd}")
+        lines.extend(f"  {cmd}" for cmd in islice(result.next_safe_commands, 3))
 
     if result.notes:
         lines.append("")
         lines.append("Notes:")
-        for n in result.notes[:5]:
-            lines.append(f"  - {n}")
+        lines.extend(f"  - {n}" for n in islice(result.notes, 5))
 
-    return "\n".join(lines) + "\n"
+    # Trailing empty line ends the output with a newline
+    lines.append("")
+    return "\n".join(lines)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import BinaryIO
 
 
 def default_state_dir() -> Path:
@@ -19,13 +20,30 @@ def last_log_path() -> Path:
 def write_last_log(text: str) -> None:
     """Write text to last.log, creating directory if needed."""
     p = last_log_path()
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(text, encoding="utf-8", errors="replace")
+    try:
+        p.write_text(text, encoding="utf-8", errors="replace")
+    except FileNotFoundError:
+        # Only the first run needs the state directory created
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(text, encoding="utf-8", errors="replace")
+
+
+def open_last_log() -> BinaryIO:
+    """Open last.log for binary writing, creating directory if needed.
+
+    Used to stream captured output straight to disk (see assist-run).
+    """
+    p = last_log_path()
+    try:
+        return open(p, "wb")
+    except FileNotFoundError:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        return open(p, "wb")
 
 
 def read_last_log() -> str:
     """Read last.log, returning empty string if not found."""
-    p = last_log_path()
-    if not p.exists():
+    try:
+        return last_log_path().read_text(encoding="utf-8", errors="replace")
+    except FileNotFoundError:
         return ""
-    return p.read_text(encoding="utf-8", errors="replace")
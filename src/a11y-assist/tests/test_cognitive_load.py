@@ -103,6 +103,11 @@ class TestPlanCappedAtThree:
         reduced = reduce_plan(plan)
         assert reduced == ["A.", "B.", "C."]  # After normalization adds periods
 
+    def test_reduce_plan_skips_blank_steps_before_cap(self):
+        """Blank steps do not count toward the cap."""
+        plan = ["  ", "A", "", "B", "   ", "C", "D"]
+        assert reduce_plan(plan) == ["A.", "B.", "C."]
+
     def test_empty_plan_gets_fallback(self):
         """Empty plan gets a reasonable fallback."""
         reduced = reduce_plan([])
@@ -266,6 +271,10 @@ class TestNormalizationHelpers:
         """'It may help to' becomes 'Try '."""
         assert _to_imperative("It may help to restart").startswith("Try ")
 
+    def test_normalize_step_imperative_turkish_dotted_i(self):
+        """'İt may help to' (U+0130) is rewritten like 'It may help to'."""
+        assert normalize_step("İt may help to run the tests") == "Try run the tests."
+
 
 class TestRenderCognitiveLoad:
     """Tests for cognitive-load renderer."""
@@ -409,6 +418,14 @@ class TestDeterminism:
         for output in outputs[1:]:
             assert output == first
 
+    def test_normalize_step_memoized(self):
+        """Repeated steps are served from the cache with identical output."""
+        normalize_step.cache_clear()
+        first = normalize_step("Run: check the config and restart")
+        second = normalize_step("Run: check the config and restart")
+        assert first == second == "check the config."
+        assert normalize_step.cache_info().hits == 1
+
     def test_render_deterministic(self):
         """Rendering is deterministic."""
         result = AssistResult(
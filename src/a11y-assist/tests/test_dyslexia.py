@@ -14,11 +14,9 @@ Verifies:
 import pytest
 
 from a11y_assist.profiles.dyslexia import (
+    _clean,
     _expand_abbreviations,
     _normalize_step,
-    _remove_parentheticals,
-    _remove_symbolic_emphasis,
-    _remove_visual_refs,
     apply_dyslexia,
 )
 from a11y_assist.profiles.dyslexia_render import render_dyslexia
@@ -28,27 +26,27 @@ from a11y_assist.render import AssistResult
 # Unit tests for helper functions
 
 
-def test_remove_parentheticals():
+def test_clean_removes_parentheticals():
     """Should remove parenthetical content."""
-    assert _remove_parentheticals("Check config (optional)") == "Check config"
-    assert _remove_parentheticals("Run command [see docs]") == "Run command"
-    assert _remove_parentheticals("No parens here") == "No parens here"
+    assert _clean("Check config (optional)") == "Check config"
+    assert _clean("Run command [see docs]") == "Run command"
+    assert _clean("No parens here") == "No parens here"
 
 
-def test_remove_visual_refs():
+def test_clean_removes_visual_refs():
     """Should remove visual navigation references."""
-    assert _remove_visual_refs("See above for details") == "for details"
-    assert _remove_visual_refs("Check below") == "Check"
-    assert _remove_visual_refs("Click the left arrow") == "Click the"
-    assert _remove_visual_refs("No visual refs") == "No visual refs"
+    assert _clean("See above for details") == "for details"
+    assert _clean("Check below") == "Check"
+    assert _clean("Click the left arrow") == "Click the"
+    assert _clean("No visual refs") == "No visual refs"
 
 
-def test_remove_symbolic_emphasis():
+def test_clean_removes_symbolic_emphasis():
     """Should remove symbolic emphasis characters."""
-    assert _remove_symbolic_emphasis("*important*") == "important"
-    assert _remove_symbolic_emphasis("_underlined_") == "underlined"
-    assert _remove_symbolic_emphasis("Step → Next") == "Step  Next"
-    assert _remove_symbolic_emphasis("No symbols") == "No symbols"
+    assert _clean("*important*") == "important"
+    assert _clean("_underlined_") == "underlined"
+    assert _clean("Step → Next") == "Step Next"
+    assert _clean("No symbols") == "No symbols"
 
 
 def test_expand_abbreviations():
@@ -335,3 +333,16 @@ def test_dyslexia_low_confidence():
 
     # ID shows as none
     assert "Anchored ID: none" in output
+
+
+def test_apply_dyslexia_repeat_returns_fresh_lists(base_result):
+    """Repeated transforms match, and mutating one result leaves later ones intact."""
+    first = apply_dyslexia(base_result)
+    first.plan.append("Injected step.")
+    first.notes.clear()
+
+    second = apply_dyslexia(base_result)
+    assert second.plan is not first.plan
+    assert "Injected step." not in second.plan
+    assert second.notes
+    assert second == apply_dyslexia(base_result)
@@ -1,13 +1,17 @@
 """Tests for the explain command (cli.error.v0.1 JSON)."""
 
+import json
 from pathlib import Path
 
 import pytest
 
+from a11y_assist import from_cli_error
 from a11y_assist.from_cli_error import (
+    MAX_REPORTED_ERRORS,
     CliErrorValidationError,
     assist_from_cli_error,
     load_cli_error,
+    load_cli_error_bytes,
 )
 
 FIX = Path(__file__).parent / "fixtures"
@@ -28,12 +32,52 @@ class TestLoadCliError:
         assert obj["code"] == "CFG001"
         assert obj["what"] == "Configuration file missing"
 
+    def test_load_from_bytes_matches_path(self):
+        """load_cli_error_bytes parses the same object as load_cli_error."""
+        path = FIX / "cli_error_good.json"
+        assert load_cli_error_bytes(path.read_bytes()) == load_cli_error(str(path))
+
     def test_load_missing_code_raises(self):
         """Missing code field raises validation error."""
         with pytest.raises(CliErrorValidationError) as exc_info:
             load_cli_error(str(FIX / "cli_error_missing_id.json"))
         assert "code" in str(exc_info.value.errors)
 
+    def test_load_without_fast_check(self, monkeypatch):
+        """jsonschema alone gives the same result when fastjsonschema is absent."""
+        monkeypatch.setattr(from_cli_error, "_cli_error_fast_check", lambda: None)
+        obj = load_cli_error(str(FIX / "cli_error_good.json"))
+        assert obj["code"] == "PAY001"
+        with pytest.raises(CliErrorValidationError) as exc_info:
+            load_cli_error(str(FIX / "cli_error_missing_id.json"))
+        assert "code" in str(exc_info.value.errors)
+
+    def test_load_caps_reported_errors(self, tmp_path):
+        """Validation stops after MAX_REPORTED_ERRORS errors."""
+        bad = {"level": 1, "code": 2, "what": 3, "why": 4, "fix": 5, "id": 6, "title": 7}
+        p = tmp_path / "bad.json"
+        p.write_text(json.dumps(bad), encoding="utf-8")
+        with pytest.raises(CliErrorValidationError) as exc_info:
+            load_cli_error(str(p))
+        assert len(exc_info.value.errors) == MAX_REPORTED_ERRORS
+
+    def test_load_orders_errors_by_numeric_index(self, monkeypatch):
+        """Array indices in error paths sort numerically (fix.2 before fix.10)."""
+        from jsonschema import Draft202012Validator
+
+        schema = {"properties": {"fix": {"type": "array", "items": {"type": "string"}}}}
+        monkeypatch.setattr(from_cli_error, "_cli_error_fast_check", lambda: None)
+        monkeypatch.setattr(
+            from_cli_error, "_cli_error_validator", lambda: Draft202012Validator(schema)
+        )
+        fix = ["ok"] * 11
+        fix[2] = 2
+        fix[10] = 10
+        with pytest.raises(CliErrorValidationError) as exc_info:
+            load_cli_error_bytes(json.dumps({"fix": fix}).encode("utf-8"))
+        locs = [err.split(":")[0] for err in exc_info.value.errors]
+        assert locs == ["fix.2", "fix.10"]
+
 
 class TestAssistFromCliError:
     """Tests for generating assist from cli.error.v0.1."""
@@ -9,6 +9,7 @@ from a11y_assist.guard import (
     GuardContext,
     GuardIssue,
     GuardViolation,
+    _tokenize_content,
     get_guard_context,
     validate_profile_transform,
 )
@@ -309,6 +310,23 @@ def test_guard_command_with_dollar_prefix_passes(base_result_high: AssistResult,
     validate_profile_transform(base_text, base_result_high, profiled, ctx)
 
 
+def test_guard_context_normalizes_allowed_commands():
+    """Allowed commands are normalized once; prefix on either side matches."""
+    ctx = GuardContext(
+        profile="lowvision",
+        confidence="High",
+        input_kind="cli_error_json",
+        allowed_safe_commands=frozenset({"$ fix --dry-run "}),
+    )
+    assert ctx.allowed_safe_commands == frozenset({"fix --dry-run"})
+    assert ctx == GuardContext(
+        profile="lowvision",
+        confidence="High",
+        input_kind="cli_error_json",
+        allowed_safe_commands=frozenset({"$ fix --dry-run "}),
+    )
+
+
 # Test: Step Count Invariant
 
 
@@ -564,6 +582,36 @@ def test_guard_visual_refs_below_forbidden():
     )
 
 
+def test_guard_text_constraints_report_each_field():
+    """Text constraint issues name exactly the offending fields."""
+    base = AssistResult(
+        anchored_id="TEST.ERROR.001",
+        confidence="High",
+        safest_next_step="Check the output",
+        plan=["Step 1", "Step 2 (optional)", "Step 3"],
+        next_safe_commands=[],
+        notes=["Scroll up", "Details are on the left"],
+    )
+
+    ctx = get_guard_context(
+        profile="screen-reader",
+        confidence="High",
+        input_kind="cli_error_json",
+        allowed_commands=set(),
+    )
+
+    with pytest.raises(GuardViolation) as exc_info:
+        validate_profile_transform("test content output", base, base, ctx)
+
+    fields = {
+        (issue.code, issue.details["field"]) for issue in exc_info.value.issues
+    }
+    assert fields == {
+        ("A11Y.ASSIST.GUARD.TEXT.PARENTHETICALS_FORBIDDEN", "plan[1]"),
+        ("A11Y.ASSIST.GUARD.TEXT.VISUAL_REFS_FORBIDDEN", "notes[1]"),
+    }
+
+
 def test_guard_lowvision_allows_parentheticals():
     """Lowvision profile should allow parentheticals."""
     base = AssistResult(
@@ -817,3 +865,12 @@ def test_guard_none_id_preserved():
 
     # Should not raise
     validate_profile_transform("Check output", base, profiled, ctx)
+
+
+def test_tokenize_content_ascii_and_unicode_agree():
+    """ASCII fast path and regex fallback split words the same way."""
+    assert _tokenize_content("Re-run: CONFIG.json (the file)") == {
+        "run", "config", "json", "file",
+    }
+    # Non-ASCII letters are separators, as with the regex
+    assert _tokenize_content("Caf\u00e9 config") == {"caf", "config"}
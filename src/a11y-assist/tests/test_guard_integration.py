@@ -81,6 +81,20 @@ def test_explain_screen_reader_passes_guard(runner: CliRunner, json_file: str):
     assert "TEST.CONFIG.MISSING" in result.output
 
 
+def test_explain_json_response_and_json_out(runner: CliRunner, json_file: str, tmp_path):
+    """--json-response prints the same JSON that --json-out writes."""
+    out = tmp_path / "response.json"
+    result = runner.invoke(
+        main, ["explain", "--json", json_file, "--json-response", "--json-out", str(out)]
+    )
+
+    assert result.exit_code == 0
+    printed = json.loads(result.output)
+    assert printed == json.loads(out.read_text(encoding="utf-8"))
+    assert printed["anchored_id"] == "TEST.CONFIG.MISSING"
+    assert "guard.validate_profile_transform" in printed["methods_applied"]
+
+
 # Integration: triage command with guard
 
 
@@ -11,6 +11,7 @@ import pytest
 from a11y_assist.ingest import (
     IngestError,
     build_advisories,
+    canonical_sha256,
     canonicalize,
     group_by_file,
     group_by_rule,
@@ -192,6 +193,27 @@ class TestCanonicalize:
     def test_strings_escaped(self):
         assert canonicalize('hello "world"') == '"hello \\"world\\""'
 
+    def test_non_ascii_escaped(self):
+        assert canonicalize({"t": "caf\u00e9"}) == '{"t":"caf\\u00e9"}'
+
+    def test_non_finite_rejected(self):
+        with pytest.raises(ValueError, match="Non-finite"):
+            canonicalize({"x": [float("nan")]})
+
+    def test_non_json_type_rejected(self):
+        with pytest.raises(ValueError, match="Non-JSON value type"):
+            canonicalize({"x": {1, 2}})
+
+    def test_canonical_sha256_matches_one_shot(self, monkeypatch):
+        import hashlib
+
+        from a11y_assist import ingest
+
+        monkeypatch.setattr(ingest, "DIGEST_CHUNK_SIZE", 7)
+        value = {"b": ["x" * 40, 1.5], "a": None}
+        expected = hashlib.sha256(canonicalize(value).encode("utf-8")).hexdigest()
+        assert canonical_sha256(value) == expected
+
 
 class TestGroupByRule:
     def test_groups_correctly(self, sample_findings: Path):
@@ -236,6 +258,11 @@ class TestIngest:
         assert len(result.findings) == 4
         assert len(result.by_rule) == 3
 
+    def test_ingested_at_can_be_injected(self, sample_findings: Path):
+        result = ingest(sample_findings, now_iso="2026-01-26T00:00:00+00:00")
+
+        assert result.ingested_at == "2026-01-26T00:00:00+00:00"
+
     def test_filter_by_severity(self, sample_findings: Path):
         result = ingest(sample_findings, min_severity="error")
 
@@ -309,3 +336,34 @@ class TestVerifyProvenance:
         for finding in data["findings"]:
             success, error = verify_provenance(finding, base_dir)
             assert success, f"Failed for {finding['finding_id']}: {error}"
+
+    def test_valid_provenance_with_wide_integer(self, tmp_path: Path):
+        """Integers wider than 64 bits keep their exact canonical digest."""
+        import hashlib
+
+        evidence = {"n": 2**70}
+        digest_value = hashlib.sha256(canonicalize(evidence).encode("utf-8")).hexdigest()
+        prov_dir = tmp_path / "provenance"
+        prov_dir.mkdir()
+        record = {
+            "prov.record.v0.1": {"outputs": [{"artifact.v0.1": {"content": evidence}}]}
+        }
+        digest = {
+            "prov.record.v0.1": {
+                "outputs": [{"artifact.v0.1": {"digest": {"value": digest_value}}}]
+            }
+        }
+        (prov_dir / "record.json").write_text(json.dumps(record))
+        (prov_dir / "digest.json").write_text(json.dumps(digest))
+        (prov_dir / "envelope.json").write_text("{}")
+        finding = {
+            "finding_id": "test-001",
+            "evidence_ref": {
+                "record": "provenance/record.json",
+                "digest": "provenance/digest.json",
+                "envelope": "provenance/envelope.json",
+            },
+        }
+
+        success, error = verify_provenance(finding, tmp_path)
+        assert success, error
@@ -0,0 +1,46 @@
+"""Tests for JSON encode/decode helpers."""
+
+import json
+
+import pytest
+
+from a11y_assist import jsonio
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with the detected backend and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+class TestJsonIO:
+    """Both backends must produce equivalent JSON."""
+
+    def test_dumps_pretty_matches_stdlib(self, backend):
+        """Pretty output matches json.dumps(indent=2) for ASCII payloads."""
+        obj = {"plan": ["a", "b"], "anchored_id": None, "evidence": []}
+        assert jsonio.dumps_pretty(obj) == json.dumps(obj, indent=2)
+
+    def test_dumps_pretty_bytes_is_utf8_of_text(self, backend):
+        """Bytes output is the UTF-8 encoding of the text output."""
+        obj = {"notes": ["caf\u00e9"], "plan": []}
+        assert jsonio.dumps_pretty_bytes(obj).decode("utf-8") == jsonio.dumps_pretty(obj)
+
+    def test_non_ascii_written_unescaped(self, backend):
+        """Non-ASCII text is emitted as UTF-8, not \\uXXXX escapes."""
+        obj = {"notes": ["\u8a2d\u5b9a caf\u00e9"]}
+        out = jsonio.dumps_pretty_bytes(obj)
+        assert b"\\u" not in out
+        assert out.decode("utf-8") == json.dumps(obj, indent=2, ensure_ascii=False)
+
+    def test_loads_bytes_and_text(self, backend):
+        """loads accepts both bytes and str."""
+        assert jsonio.loads(b'{"id": "A.B"}') == {"id": "A.B"}
+        assert jsonio.loads('{"id": "A.B"}') == {"id": "A.B"}
+
+    def test_loads_invalid_raises_json_error(self, backend):
+        """Invalid input raises json.JSONDecodeError on either backend."""
+        with pytest.raises(json.JSONDecodeError):
+            jsonio.loads(b"{not json")
@@ -20,6 +20,7 @@ from a11y_assist.methods import (
     METHOD_PROFILE_LOWVISION,
     METHOD_PROFILE_PLAIN_LANGUAGE,
     METHOD_PROFILE_SCREEN_READER,
+    with_evidence,
     with_method,
     with_methods,
 )
@@ -196,6 +197,31 @@ class TestWithMethodsHelpers:
         assert "method.b" in updated.methods_applied
         assert "method.c" in updated.methods_applied
 
+    def test_with_methods_dedupes_within_batch_in_order(self, base_result):
+        """with_methods keeps first-seen order and drops repeats in the batch."""
+        updated = with_methods(base_result, ["method.a", "method.b", "method.a"])
+        updated = with_methods(updated, ["method.b", "method.c"])
+        assert updated.methods_applied == ("method.a", "method.b", "method.c")
+
+    def test_with_methods_noop_returns_same_result(self, base_result):
+        """with_methods returns the input unchanged when nothing is new."""
+        updated = with_methods(base_result, ["method.a"])
+        assert with_methods(updated, ["method.a"]) is updated
+        assert with_methods(updated, []) is updated
+
+    def test_with_method_noop_returns_same_result(self, base_result):
+        """with_method returns the input unchanged when already present."""
+        updated = with_method(base_result, "method.a")
+        assert with_method(updated, "method.a") is updated
+
+    def test_with_evidence_appends_in_order(self, base_result):
+        """with_evidence appends anchors after existing ones."""
+        first = Evidence(field="plan[0]", source="cli.error.fix[0]")
+        second = Evidence(field="plan[1]", source="cli.error.fix[1]")
+        updated = with_evidence(with_evidence(base_result, [first]), [second])
+        assert updated.evidence == (first, second)
+        assert with_evidence(updated, []) is updated
+
 
 class TestMethodIDConstants:
     """Verify method ID constants are stable and well-formed."""
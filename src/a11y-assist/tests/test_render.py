@@ -1,6 +1,6 @@
 """Tests for render output."""
 
-from a11y_assist.render import AssistResult, render_assist
+from a11y_assist.render import AssistResult, Evidence, render_assist, to_response_dict
 
 
 class TestRenderAssist:
@@ -115,3 +115,40 @@ class TestRenderAssist:
         output = render_assist(result)
         assert "Notes:" in output
         assert "- Note one" in output
+
+
+class TestToResponseDict:
+    """Tests for assist.response.v0.1 serialization."""
+
+    def test_response_dict_fields(self):
+        """All response fields are present as JSON-friendly types."""
+        result = AssistResult(
+            anchored_id="TEST.ID",
+            confidence="High",
+            safest_next_step="Do it.",
+            plan=["Step 1"],
+            next_safe_commands=["tool --dry-run"],
+            notes=["Note"],
+            methods_applied=("profile.lowvision.apply",),
+            evidence=(Evidence(field="plan[0]", source="cli.error.fix[0]"),),
+        )
+        d = to_response_dict(result)
+        assert d["anchored_id"] == "TEST.ID"
+        assert d["plan"] == ["Step 1"]
+        assert d["methods_applied"] == ["profile.lowvision.apply"]
+        assert d["evidence"] == [{"field": "plan[0]", "source": "cli.error.fix[0]"}]
+
+    def test_response_dict_keeps_evidence_note(self):
+        """Evidence notes are included only when set."""
+        result = AssistResult(
+            anchored_id=None,
+            confidence="Low",
+            safest_next_step="Do it.",
+            plan=["Step 1"],
+            next_safe_commands=[],
+            notes=[],
+            evidence=(Evidence(field="plan[0]", source="raw_text:Fix:1", note="first"),),
+        )
+        d = to_response_dict(result)
+        assert d["anchored_id"] is None
+        assert d["evidence"][0]["note"] == "first"
@@ -18,13 +18,9 @@ from a11y_assist.profiles.screen_reader import (
     MAX_STEP_LENGTH,
     MAX_STEPS_DEFAULT,
     MAX_STEPS_LOW,
-    _cap_length,
-    _expand_abbreviations,
-    _one_sentence,
-    _remove_parentheticals,
-    _remove_visual_references,
-    _replace_symbols,
+    _finalize,
     _strip_boilerplate,
+    _tts_clean,
     apply_screen_reader,
     generate_summary,
     normalize_safest_step,
@@ -277,63 +273,63 @@ class TestNormalizationHelpers:
 
     def test_remove_parentheticals_round(self):
         """Round parentheses content is removed."""
-        assert _remove_parentheticals("Do thing (optional)") == "Do thing"
+        assert _tts_clean("Do thing (optional)") == "Do thing"
 
     def test_remove_parentheticals_square(self):
         """Square bracket content is removed."""
-        assert _remove_parentheticals("Run [see docs]") == "Run"
+        assert _tts_clean("Run [see docs]") == "Run"
 
     def test_remove_visual_references_see_above(self):
         """'see above' is removed."""
-        result = _remove_visual_references("Check see above for info")
+        result = _tts_clean("Check see above for info")
         assert "above" not in result.lower()
 
     def test_remove_visual_references_below(self):
         """'below' is removed."""
-        result = _remove_visual_references("Look at the output below")
+        result = _tts_clean("Look at the output below")
         assert "below" not in result.lower()
 
     def test_remove_visual_references_arrow(self):
         """'arrow' is removed."""
-        result = _remove_visual_references("Click the arrow")
+        result = _tts_clean("Click the arrow")
         assert "arrow" not in result.lower()
 
     def test_expand_abbreviations_cli(self):
         """CLI expands to 'command line'."""
-        assert "command line" in _expand_abbreviations("Use the CLI tool")
+        assert "command line" in _tts_clean("Use the CLI tool")
 
     def test_expand_abbreviations_id(self):
         """ID expands to 'I D'."""
-        assert "I D" in _expand_abbreviations("Check the ID")
+        assert "I D" in _tts_clean("Check the ID")
 
     def test_expand_abbreviations_json(self):
         """JSON expands to 'J S O N'."""
-        assert "J S O N" in _expand_abbreviations("Parse JSON")
+        assert "J S O N" in _tts_clean("Parse JSON")
 
     def test_expand_abbreviations_sftp(self):
         """SFTP expands to 'S F T P'."""
-        assert "S F T P" in _expand_abbreviations("Upload via SFTP")
+        assert "S F T P" in _tts_clean("Upload via SFTP")
 
     def test_replace_symbols_arrow(self):
         """-> replaces with 'to'."""
-        assert " to " in _replace_symbols("A -> B")
+        assert " to " in _tts_clean("A -> B")
 
     def test_replace_symbols_fat_arrow(self):
         """=> replaces with 'to'."""
-        assert " to " in _replace_symbols("A => B")
+        assert " to " in _tts_clean("A => B")
 
     def test_replace_symbols_ampersand(self):
         """& replaces with 'and'."""
-        assert " and " in _replace_symbols("A & B")
+        assert " and " in _tts_clean("A & B")
 
     def test_one_sentence_semicolon(self):
         """Semicolon splits and keeps first."""
-        result = _one_sentence("First part; second part")
+        result = _finalize("First part; second part", MAX_STEP_LENGTH)
         assert "second" not in result
 
     def test_cap_length_adds_ellipsis(self):
         """Long strings are capped with ellipsis."""
-        result = _cap_length("A" * 200, 100)
+        result = _finalize("A" * 200, 100)
         assert len(result) == 100
         assert result.endswith("…")
 
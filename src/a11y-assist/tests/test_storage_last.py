@@ -8,6 +8,7 @@ import pytest
 from a11y_assist.storage import (
     default_state_dir,
     last_log_path,
+    open_last_log,
     read_last_log,
     write_last_log,
 )
@@ -32,6 +33,15 @@ class TestLastLogStorage:
         expected_dir = tmp_path / ".a11y-assist"
         assert expected_dir.exists()
 
+    def test_open_last_log_streams_bytes(self, tmp_path, monkeypatch):
+        """Chunks written through open_last_log are readable via read_last_log."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        with open_last_log() as f:
+            f.write(b"[ERROR] first\n")
+            f.write(b"  second\n")
+        assert read_last_log() == "[ERROR] first\n  second\n"
+
     def test_read_nonexistent_returns_empty(self, tmp_path, monkeypatch):
         """Reading nonexistent last.log returns empty string."""
         monkeypatch.setattr(Path, "home", lambda: tmp_path)
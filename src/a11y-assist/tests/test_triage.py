@@ -84,3 +84,11 @@ class TestParseRaw:
         text = "[WARN] Something might be wrong"
         err_id, status, blocks = parse_raw(text)
         assert status == "WARN"
+
+    def test_parse_raw_repeat_calls_are_independent(self):
+        """Memoized results hand out fresh block lists on each call."""
+        text = (FIX / "raw_good.txt").read_text(encoding="utf-8")
+        _, _, first = parse_raw(text)
+        first["Fix:"].append("mutated")
+        _, _, second = parse_raw(text)
+        assert "mutated" not in second["Fix:"]
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from importlib import resources
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Sequence
 
-from jsonschema import Draft202012Validator
+from .jsonio import load_path
+
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
 
 
 def _load_schema() -> Dict[str, Any]:
@@ -18,8 +22,25 @@ def _load_schema() -> Dict[str, Any]:
         return json.load(f)
 
 
-_SCHEMA = _load_schema()
-_VALIDATOR = Draft202012Validator(_SCHEMA)
+# Schema errors listed in an AllowlistError before truncating
+_MAX_ERRORS = 20
+
+
+@lru_cache(maxsize=1)
+def _get_validator() -> "Draft202012Validator":
+    """Build the allowlist validator on first use.
+
+    jsonschema is slow to import, so it is only loaded when an allowlist is.
+    """
+    from jsonschema import Draft202012Validator
+
+    return Draft202012Validator(_load_schema())
+
+
+@lru_cache(maxsize=512)
+def _parse_iso_date(s: str) -> date:
+    """Parse a yyyy-mm-dd expiry; allowlists often share the same dates."""
+    return date.fromisoformat(s)
 
 
 class AllowlistError(Exception):
@@ -38,23 +59,48 @@ class AllowlistEntry:
     reason: str
     owner: str
     ticket: Optional[str] = None
+    # Parsed once from expires; -1 marks an invalid date (always expired)
+    expires_ordinal: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        try:
+            ordinal = _parse_iso_date(self.expires).toordinal()
+        except ValueError:
+            ordinal = -1
+        object.__setattr__(self, "expires_ordinal", ordinal)
 
 
 @dataclass(frozen=True)
 class Allowlist:
     """Parsed allowlist with entries."""
 
-    entries: List[AllowlistEntry]
+    # Stored as a tuple so the lookup sets below cannot go stale
+    entries: Sequence[AllowlistEntry]
+    # Lookup sets built once so is_suppressed is O(1) per finding
+    _id_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _fp_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "entries", tuple(self.entries))
+        ids = frozenset(e.id for e in self.entries if e.kind == "id")
+        fps = frozenset(e.id for e in self.entries if e.kind == "fingerprint")
+        object.__setattr__(self, "_id_set", ids)
+        object.__setattr__(self, "_fp_set", fps)
 
     @staticmethod
     def load(path: str) -> "Allowlist":
         """Load and validate an allowlist from a JSON file."""
-        obj = json.loads(Path(path).read_text(encoding="utf-8"))
-        errors = []
-        for e in sorted(_VALIDATOR.iter_errors(obj), key=lambda x: x.path):
-            loc = ".".join([str(p) for p in e.path]) or "(root)"
-            errors.append(f"{loc}: {e.message}")
-        if errors:
+        obj = load_path(path)
+        # Valid allowlists yield no errors; only sort and format on failure,
+        # and stop collecting once there are more than we would report
+        validation_errors = list(islice(_get_validator().iter_errors(obj), _MAX_ERRORS + 1))
+        if validation_errors:
+            errors = []
+            for e in sorted(validation_errors[:_MAX_ERRORS], key=lambda x: tuple(x.path)):
+                loc = ".".join([str(p) for p in e.path]) or "(root)"
+                errors.append(f"{loc}: {e.message}")
+            if len(validation_errors) > _MAX_ERRORS:
+                errors.append("(more errors truncated)")
             raise AllowlistError("allowlist validation failed:\n" + "\n".join(errors))
 
         allow = obj.get("allow", [])
@@ -82,45 +128,28 @@ class Allowlist:
         return Allowlist(entries=entries)
 
     def is_suppressed(self, f: Dict[str, Any]) -> bool:
-        """Check if a finding is suppressed by any active entry."""
-        # Note: Expiry check should happen before calling this, or we rely on caller to filter expired entries first.
-        # However, for simplicity here, we assume 'self.entries' contains valid entries.
-        # But wait, 'expired_entries' filters them out? No, that just returns them.
-        
+        """Check if a finding is suppressed by any entry.
+
+        Expired entries are not filtered here; callers apply
+        active_entries() first (see gate.gate).
+        """
         # We need to check both ID and Fingerprint
         fid = f.get("id")
+        if fid is not None and fid in self._id_set:
+            return True
         fp = f.get("fingerprint")
-        
-        for e in self.entries:
-            if e.kind == "id" and e.id == fid:
-                return True
-            if e.kind == "fingerprint" and e.id == fp:
-                return True
-        return False
-
-    def suppressed_ids(self) -> Set[str]:
+        return fp is not None and fp in self._fp_set
+
+    def suppressed_ids(self) -> FrozenSet[str]:
         """Get set of finding IDs that are suppressed (legacy helper)."""
-        return {e.id for e in self.entries if e.kind == "id"}
+        return self._id_set
 
     def expired_entries(self, today: Optional[date] = None) -> List[AllowlistEntry]:
         """Get list of entries that have expired."""
-        today = today or date.today()
-        expired: List[AllowlistEntry] = []
-        for e in self.entries:
-            try:
-                # expires is ISO date yyyy-mm-dd
-                y, m, d = e.expires.split("-")
-                exp = date(int(y), int(m), int(d))
-                if exp < today:
-                    expired.append(e)
-            except ValueError:
-                # Invalid date format, treat as expired/invalid
-                expired.append(e)
-        return expired
+        today_ordinal = (today or date.today()).toordinal()
+        return [e for e in self.entries if e.expires_ordinal < today_ordinal]
 
     def active_entries(self, today: Optional[date] = None) -> "Allowlist":
         """Return new Allowlist with only non-expired entries."""
-        today = today or date.today()
-        # reusing logic above roughly
-        exps = set(self.expired_entries(today))
-        return Allowlist(entries=[e for e in self.entries if e not in exps])
+        today_ordinal = (today or date.today()).toordinal()
+        return Allowlist(entries=[e for e in self.entries if e.expires_ordinal >= today_ordinal])
@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import click
 import json
-import jsonschema
 from pathlib import Path
 
 from . import __version__
 from .allowlist import Allowlist, AllowlistError
 from .gate import gate
 from .render import CliMessage, render
+from .report import get_json_report, render_text_report
 from .scorecard import Scorecard
 
 EXIT_PASS = 0
@@ -137,6 +137,9 @@ def gate_cmd(
         # Using exit code 2 to match click
         raise SystemExit(EXIT_INPUT_ERROR)
 
+    # Deferred so --help and --version don't pay for importing jsonschema
+    import jsonschema
+
     try:
         current = Scorecard.load(current_path)
         baseline = Scorecard.load(baseline_path) if baseline_path else None
@@ -206,37 +209,36 @@ def gate_cmd(
                 f.write(payload_json)
         elif emit_mcp:
             click.echo(payload_json)
-            
-        if artifact_dir:
-            out_dir = Path(artifact_dir)
-            out_dir.mkdir(parents=True, exist_ok=True)
-            
-            # 1. Evidence
-            (out_dir / "evidence.json").write_text(payload_json, encoding="utf-8")
-            
-            # 2. Gate Result
-            from .report import get_json_report
-            (out_dir / "gate-result.json").write_text(json.dumps(get_json_report(result), indent=2), encoding="utf-8")
-            
-            # 3. Text Report
-            from .report import render_text_report
-            (out_dir / "report.txt").write_text(render_text_report(result, top=top), encoding="utf-8")
-
-    if result.ok:
-        if output_format == "json":
-            from .report import print_json_report
-            print_json_report(result)
-        else:
-            from .report import print_text_report
-            print_text_report(result)
-        raise SystemExit(EXIT_PASS)
-
-    # Failure case
+
+    # Build each report once; the artifact files and stdout share them
+    gate_json = (
+        json.dumps(get_json_report(result), indent=2)
+        if artifact_dir or output_format == "json"
+        else None
+    )
+    report_text = (
+        render_text_report(result, top=top)
+        if artifact_dir or output_format != "json"
+        else None
+    )
+
+    if artifact_dir:
+        out_dir = Path(artifact_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        # 1. Evidence
+        (out_dir / "evidence.json").write_text(payload_json, encoding="utf-8")
+
+        # 2. Gate Result
+        (out_dir / "gate-result.json").write_text(gate_json, encoding="utf-8")
+
+        # 3. Text Report
+        (out_dir / "report.txt").write_text(report_text, encoding="utf-8")
+
+    # The pass report ignores --top, so both outcomes print the same text
     if output_format == "json":
-        from .report import print_json_report
-        print_json_report(result)
+        print(gate_json)
     else:
-        from .report import print_text_report
-        print_text_report(result, top=top)
-    
-    raise SystemExit(EXIT_FAIL)
+        print(report_text, end="")
+
+    raise SystemExit(EXIT_PASS if result.ok else EXIT_FAIL)
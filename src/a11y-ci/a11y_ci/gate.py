@@ -10,16 +10,13 @@ Rules:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional
 
 from .allowlist import Allowlist
-from .severity import (
-    SEVERITY_ORDER,
-    is_at_least,
-    normalize_severity,
-)
+from .severity import normalize_severity
 from .scorecard import (
     Scorecard,
+    ScorecardAnalysis,
     finding_id,
 )
 
@@ -43,13 +40,34 @@ def apply_allowlist(scorecard: Scorecard, allowlist: Allowlist) -> Scorecard:
         return scorecard
     # Use Allowlist.is_suppressed logic
     filtered = [f for f in scorecard.findings if not allowlist.is_suppressed(f)]
-    
+    if len(filtered) == len(scorecard.findings) and scorecard.is_canonical():
+        # Nothing suppressed and already canonical: re-canonicalizing would
+        # be a no-op, and any summary is still accurate
+        return scorecard
+
     raw = dict(scorecard.raw)
     raw["findings"] = filtered
     raw.pop("summary", None)
     return Scorecard(raw=raw, findings=filtered).canonicalize()
 
 
+def _analyze(
+    scorecard: Scorecard, fail_on: str, allowlist: Optional[Allowlist]
+) -> ScorecardAnalysis:
+    """Analyze a scorecard after removing allowlisted findings.
+
+    Canonical scorecards (anything from Scorecard.load) are filtered and
+    counted in one pass. Others are filtered and then canonicalized first,
+    so duplicate fingerprints collapse as they always have.
+    """
+    if allowlist is None:
+        return scorecard.analyze(fail_on)
+    if scorecard.is_canonical():
+        return scorecard.analyze(fail_on, allowlist.is_suppressed)
+    filtered = [f for f in scorecard.findings if not allowlist.is_suppressed(f)]
+    return Scorecard(raw=scorecard.raw, findings=filtered).canonicalize().analyze(fail_on)
+
+
 def gate(
     current: Scorecard,
     baseline: Optional[Scorecard],
@@ -84,21 +102,17 @@ def gate(
         # Create active allowlist (exclude expired) to apply filtering
         active_allowlist = allowlist.active_entries()
 
-    # Filter findings (using ONLY active entries)
-    if active_allowlist:
-        cur = apply_allowlist(current, active_allowlist)
-        base = apply_allowlist(baseline, active_allowlist) if baseline else None
-    else:
-        cur = current
-        base = baseline
+    # Filter findings (using ONLY active entries) and count them
+    cur = _analyze(current, fail_on, active_allowlist)
+    base = _analyze(baseline, fail_on, active_allowlist) if baseline else None
 
     # Calculate counts (now deterministic from findings)
-    cur_counts = cur.counts()
-    base_counts = base.counts() if base else None
+    cur_counts = cur.counts
+    base_counts = base.counts if base else None
 
     # Evaluate logic...
     # Rule 1: Finding above threshold IS A FAILURE
-    cur_blocking_ids = cur.ids_at_or_above(fail_on)
+    cur_blocking_ids = cur.blocking_ids
     if cur_blocking_ids:
         reasons.append(f"Current run has {len(cur_blocking_ids)} finding(s) at or above '{fail_on}'.")
     
@@ -108,25 +122,14 @@ def gate(
 
     if base:
         # Check for new IDs at/above threshold
-        base_blocking_ids = set(base.ids_at_or_above(fail_on))
+        base_blocking_ids = set(base.blocking_ids)
         new_ids = [bid for bid in cur_blocking_ids if bid not in base_blocking_ids]
         if new_ids:
             new_blocking_ids = sorted(new_ids)
             reasons.append(f"Regression: {len(new_ids)} new finding ID(s) introduced at or above '{fail_on}'.")
 
         # Check for new Fingerprints at/above threshold (strict regression)
-        # We need fingerprints of blocking findings
-        # Since findings are canonicalized and sorted, iterating them is fine
-        def get_blocking_fingerprints(sc: Scorecard) -> Set[str]:
-            return {
-                f.get("fingerprint", "")
-                for f in sc.findings_at_or_above(fail_on)
-                if f.get("fingerprint")
-            }
-        
-        cur_fps = get_blocking_fingerprints(cur)
-        base_fps = get_blocking_fingerprints(base)
-        new_fps = sorted(cur_fps - base_fps)
+        new_fps = sorted(cur.blocking_fingerprints - base.blocking_fingerprints)
         if new_fps:
             new_fingerprints = new_fps
             # If new fingerprint but same ID, it's a new instance -> still regression?
@@ -141,15 +144,8 @@ def gate(
             pass
 
         # Check for count increase at threshold (optional but good hygiene)
-        def count_at_or_above(counts: Dict[str, int], thr: str) -> int:
-            total = 0
-            for sev, n in counts.items():
-                if is_at_least(sev, thr):
-                    total += n
-            return total
-
-        cur_total = count_at_or_above(cur_counts, fail_on)
-        base_total = count_at_or_above(base_counts, fail_on)
+        cur_total = cur.blocking_total
+        base_total = base.blocking_total
         if cur_total > base_total:
              reasons.append(f"Regression: Count of findings at/above '{fail_on}' increased from {base_total} to {cur_total}.")
 
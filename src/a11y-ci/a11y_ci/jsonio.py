@@ -0,0 +1,33 @@
+"""JSON decode helpers.
+
+Uses orjson when it is installed (pip install a11y-ci[fast]) and falls
+back to the stdlib json module otherwise. Both paths produce the same
+Python objects for the scorecard and allowlist inputs this tool reads.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or text.
+
+    orjson parses bytes directly, so prefer passing Path.read_bytes()
+    output to skip a separate decode pass.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_path(path: Union[str, Path]) -> Any:
+    """Read and parse a UTF-8 JSON file."""
+    return loads(Path(path).read_bytes())
@@ -10,14 +10,14 @@ from __future__ import annotations
 import hashlib
 import json
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import jsonschema
+from typing import Any, Callable, Dict, List, Optional, Set
 
+from .jsonio import load_path
 from .severity import (
     SEVERITY_ORDER,
-    is_at_least,
+    SEVERITY_RANK,
     normalize_severity,
     severity_rank,
 )
@@ -49,6 +49,35 @@ def finding_id(f: Dict[str, Any]) -> str:
 # Remove legacy severity functions (now in severity.py)
 
 
+_SCHEMA_PATH = Path(__file__).parent / "schema" / "scorecard.schema.json"
+
+
+@lru_cache(maxsize=1)
+def _scorecard_validator() -> Any:
+    """Build the scorecard validator once per process.
+
+    jsonschema.validate() re-checks the schema against its metaschema and
+    builds a new validator on every call; this does both once. jsonschema
+    is slow to import, so it is only loaded when a scorecard is.
+    """
+    from jsonschema.validators import validator_for
+
+    schema = load_path(_SCHEMA_PATH)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+@dataclass(frozen=True)
+class ScorecardAnalysis:
+    """Counts and blocking findings gathered in one pass over a scorecard."""
+
+    counts: Dict[str, int]
+    blocking_ids: List[str]  # sorted, unique
+    blocking_fingerprints: Set[str]
+    blocking_total: int  # findings at/above threshold (not de-duped by ID)
+
+
 @dataclass(frozen=True)
 class Scorecard:
     """Parsed scorecard with findings and computed counts."""
@@ -59,17 +88,21 @@ class Scorecard:
     @staticmethod
     def load(path: str) -> "Scorecard":
         """Load a scorecard from a JSON file."""
-        p = Path(path)
-        obj = json.loads(p.read_text(encoding="utf-8"))
+        obj = load_path(path)
 
         # Validate against schema
         try:
-            schema_path = Path(__file__).parent / "schema" / "scorecard.schema.json"
-            schema = json.loads(schema_path.read_text(encoding="utf-8"))
-            jsonschema.validate(instance=obj, schema=schema)
+            validator = _scorecard_validator()
         except FileNotFoundError:
             # Fallback for dev/test environments where schema might not be installed alongside
-            pass
+            validator = None
+        if validator is not None:
+            from jsonschema.exceptions import best_match
+
+            # Same error selection as jsonschema.validate()
+            error = best_match(validator.iter_errors(obj))
+            if error is not None:
+                raise error
 
         findings = obj.get("findings") or []
         if not isinstance(findings, list):
@@ -127,6 +160,25 @@ class Scorecard:
         return replace(self, findings=sorted_findings)
 
 
+    def is_canonical(self) -> bool:
+        """Check whether canonicalize() would leave the findings unchanged.
+
+        True when every finding has an id and a fingerprint, fingerprints
+        are unique, and findings are in canonical sort order.
+        """
+        seen: Set[str] = set()
+        prev = None
+        for f in self.findings:
+            fp = f.get("fingerprint")
+            if "id" not in f or not fp or fp in seen:
+                return False
+            seen.add(fp)
+            key = (-1 * severity_rank(f.get("severity", "info")), f.get("id", ""), fp)
+            if prev is not None and key < prev:
+                return False
+            prev = key
+        return True
+
     def counts(self) -> Dict[str, int]:
         """Get severity counts. Computed from canonical findings (ignores legacy summary)."""
         out = {k: 0 for k in SEVERITY_ORDER}
@@ -137,19 +189,52 @@ class Scorecard:
 
     def ids_at_or_above(self, threshold: str) -> List[str]:
         """Get sorted list of finding IDs at or above severity threshold."""
-        thr = normalize_severity(threshold)
+        thr = SEVERITY_RANK[normalize_severity(threshold)]
         ids = []
         for f in self.findings:
             sev = normalize_severity(str(f.get("severity")))
-            if is_at_least(sev, thr):
+            if SEVERITY_RANK[sev] >= thr:
                 ids.append(finding_id(f))
         return sorted(set(ids))
 
     def findings_at_or_above(self, threshold: str) -> List[Dict[str, Any]]:
         """Get findings at or above severity threshold."""
-        thr = normalize_severity(threshold)
+        thr = SEVERITY_RANK[normalize_severity(threshold)]
         return [
             f
             for f in self.findings
-            if is_at_least(normalize_severity(str(f.get("severity"))), thr)
+            if SEVERITY_RANK[normalize_severity(str(f.get("severity")))] >= thr
         ]
+
+    def analyze(
+        self,
+        threshold: str,
+        is_suppressed: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> ScorecardAnalysis:
+        """Compute counts and blocking IDs/fingerprints in a single traversal.
+
+        Equivalent to counts(), ids_at_or_above() and findings_at_or_above()
+        over the findings that is_suppressed (if given) does not reject.
+        """
+        thr = SEVERITY_RANK[normalize_severity(threshold)]
+        counts = {k: 0 for k in SEVERITY_ORDER}
+        ids: Set[str] = set()
+        fingerprints: Set[str] = set()
+        total = 0
+        for f in self.findings:
+            if is_suppressed is not None and is_suppressed(f):
+                continue
+            sev = normalize_severity(str(f.get("severity", "info")))
+            counts[sev] += 1
+            if SEVERITY_RANK[sev] >= thr:
+                total += 1
+                ids.add(finding_id(f))
+                fp = f.get("fingerprint")
+                if fp:
+                    fingerprints.add(fp)
+        return ScorecardAnalysis(
+            counts=counts,
+            blocking_ids=sorted(ids),
+            blocking_fingerprints=fingerprints,
+            blocking_total=total,
+        )
@@ -3,7 +3,7 @@ import json
 from datetime import date, timedelta
 from pathlib import Path
 import pytest
-from a11y_ci.allowlist import Allowlist
+from a11y_ci.allowlist import Allowlist, AllowlistEntry, AllowlistError
 
 def test_allowlist_loading_and_filtering(tmp_path):
     """Test loading allowlist with IDs and fingerprints."""
@@ -95,3 +95,79 @@ def test_allowlist_legacy_support(tmp_path):
     al = Allowlist.load(str(p))
     assert al.entries[0].id == "LEGACY"
     assert al.entries[0].kind == "id"
+
+def test_allowlist_validation_errors_are_reported(tmp_path):
+    """Test that schema errors name the offending paths."""
+    data = {
+        "version": "1",
+        "allow": [
+            {
+                "id": "BAD.DATE",
+                "expires": "someday",
+                "reason": "Short",
+                "owner": "Arch"
+            }
+        ]
+    }
+    p = tmp_path / "allow.json"
+    p.write_text(json.dumps(data))
+
+    with pytest.raises(AllowlistError) as exc:
+        Allowlist.load(str(p))
+    message = str(exc.value)
+    assert message.startswith("allowlist validation failed:")
+    assert "allow.0.expires:" in message
+    assert "allow.0.reason:" in message
+
+def test_allowlist_invalid_expiry_counts_as_expired():
+    """Test that an impossible expiry date is treated as expired."""
+    bad = AllowlistEntry(
+        id="BAD.DATE", kind="id", expires="2030-02-30", reason="Typo in date", owner="Arch"
+    )
+    good = AllowlistEntry(
+        id="GOOD.DATE", kind="id", expires="2030-02-28", reason="Valid date", owner="Arch"
+    )
+    al = Allowlist(entries=[bad, good])
+
+    today = date(2030, 1, 1)
+    assert al.expired_entries(today) == [bad]
+    assert al.active_entries(today).entries == (good,)
+
+def test_allowlist_suppression_matches_kind():
+    """Test that IDs and fingerprints only match their own finding field."""
+    fp = "c" * 64
+    al = Allowlist(entries=[
+        AllowlistEntry(id="ID.ONLY", kind="id", expires="2030-01-01", reason="r", owner="o"),
+        AllowlistEntry(id=fp, kind="fingerprint", expires="2030-01-01", reason="r", owner="o"),
+    ])
+
+    assert al.is_suppressed({"id": "ID.ONLY", "fingerprint": "d" * 64})
+    assert al.is_suppressed({"id": "OTHER", "fingerprint": fp})
+    assert not al.is_suppressed({"fingerprint": "ID.ONLY"})
+    assert not al.is_suppressed({"id": fp})
+    assert not al.is_suppressed({})
+    assert al.suppressed_ids() == frozenset({"ID.ONLY"})
+
+def test_allowlist_validation_errors_are_truncated(tmp_path):
+    """Test that a broadly invalid allowlist reports a bounded error list."""
+    data = {
+        "version": "1",
+        "allow": [{"id": "X", "expires": "soon", "reason": "r", "owner": "o"}] * 10
+    }
+    p = tmp_path / "allow.json"
+    p.write_text(json.dumps(data))
+
+    with pytest.raises(AllowlistError) as exc:
+        Allowlist.load(str(p))
+    lines = str(exc.value).splitlines()
+    assert lines[0] == "allowlist validation failed:"
+    assert lines[-1] == "(more errors truncated)"
+    assert len(lines) == 1 + 20 + 1
+
+def test_allowlist_entries_are_immutable():
+    """Entries are stored as a tuple so the suppression index stays in sync."""
+    entry = AllowlistEntry(id="ID.ONE", kind="id", expires="2030-01-01", reason="r", owner="o")
+    al = Allowlist(entries=[entry])
+    assert al.entries == (entry,)
+    with pytest.raises(AttributeError):
+        al.entries.append(entry)
@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 from a11y_ci.allowlist import Allowlist
-from a11y_ci.gate import gate
+from a11y_ci.gate import apply_allowlist, gate
 from a11y_ci.scorecard import Scorecard
 
 FIX = Path(__file__).parent / "fixtures"
@@ -80,6 +80,42 @@ class TestGateWithAllowlist:
         assert not result.ok
         assert any("expired" in r.lower() for r in result.reasons)
 
+    def test_allowlist_with_uncanonicalized_scorecard(self):
+        """Scorecards built directly are de-duplicated before counting."""
+        dup = {"id": "A.DUP", "severity": "serious", "message": "m", "fingerprint": "f" * 64}
+        other = {"id": "B.OTHER", "severity": "serious", "message": "m2"}
+        current = Scorecard(raw={}, findings=[dup, dict(dup), other])
+        baseline = Scorecard(raw={}, findings=[dict(dup), dict(other)])
+        allow = Allowlist.load(str(FIX / "allowlist_ok.json"))
+
+        result = gate(current=current, baseline=baseline, fail_on="serious", allowlist=allow)
+        assert result.current_counts["serious"] == 2
+        assert not any("increased" in r for r in result.reasons)
+
+    def test_apply_allowlist_removes_suppressed_findings(self):
+        """apply_allowlist drops suppressed findings and the stale summary."""
+        current = Scorecard.load(str(FIX / "current_fail.json"))
+        allow = Allowlist.load(str(FIX / "allowlist_ok.json"))
+        filtered = apply_allowlist(current, allow)
+        assert filtered.findings == []
+        assert "summary" not in filtered.raw
+
+    def test_apply_allowlist_without_matches_returns_scorecard(self):
+        """apply_allowlist returns the scorecard unchanged when nothing matches."""
+        current = Scorecard.load(str(FIX / "current_ok.json"))
+        allow = Allowlist.load(str(FIX / "allowlist_ok.json"))
+        assert apply_allowlist(current, allow) is current
+
+    def test_apply_allowlist_canonicalizes_raw_scorecard(self):
+        """apply_allowlist still canonicalizes scorecards built directly."""
+        f = {"id": "A.DUP", "severity": "minor", "message": "m"}
+        current = Scorecard(raw={}, findings=[f, dict(f)])
+        allow = Allowlist.load(str(FIX / "allowlist_ok.json"))
+        filtered = apply_allowlist(current, allow)
+        assert filtered is not current
+        assert len(filtered.findings) == 1
+        assert filtered.findings[0]["fingerprint"]
+
 
 class TestScorecardLoading:
     """Tests for scorecard loading and counts."""
@@ -0,0 +1,37 @@
+"""Tests for JSON decode helpers."""
+
+import json
+
+import pytest
+
+from a11y_ci import jsonio
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with the detected backend and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+class TestJsonIO:
+    """Both backends must parse inputs identically."""
+
+    def test_loads_bytes_and_text(self, backend):
+        """loads accepts both bytes and str."""
+        assert jsonio.loads(b'{"id": "A.B"}') == {"id": "A.B"}
+        assert jsonio.loads('{"id": "A.B"}') == {"id": "A.B"}
+
+    def test_load_path_reads_utf8(self, backend, tmp_path):
+        """load_path decodes UTF-8 files without a text-mode read."""
+        p = tmp_path / "sc.json"
+        obj = {"findings": [{"id": "A.B", "message": "café 設定"}]}
+        p.write_text(json.dumps(obj, ensure_ascii=False), encoding="utf-8")
+        assert jsonio.load_path(p) == obj
+        assert jsonio.load_path(str(p)) == obj
+
+    def test_loads_invalid_raises_json_error(self, backend):
+        """Invalid input raises json.JSONDecodeError on either backend."""
+        with pytest.raises(json.JSONDecodeError):
+            jsonio.loads(b"{not json")
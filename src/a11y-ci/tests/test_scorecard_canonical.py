@@ -86,3 +86,39 @@ def test_load_canonicalizes_automatically(tmp_path):
     assert sc.findings[1]["id"] == "B"
     # Check fingerprint added
     assert "fingerprint" in sc.findings[0]
+
+def test_analyze_matches_individual_queries():
+    """analyze() should agree with counts/ids_at_or_above/findings_at_or_above."""
+    findings = [
+        {"id": "A", "severity": "critical", "message": "m1"},
+        {"id": "A", "severity": "serious", "message": "m2"},
+        {"id": "B", "severity": "serious", "message": "m3"},
+        {"id": "C", "severity": "minor", "message": "m4"},
+    ]
+    sc = Scorecard(raw={}, findings=findings).canonicalize()
+
+    result = sc.analyze("serious")
+    assert result.counts == sc.counts()
+    assert result.blocking_ids == sc.ids_at_or_above("serious") == ["A", "B"]
+    assert result.blocking_fingerprints == {
+        f["fingerprint"] for f in sc.findings_at_or_above("serious")
+    }
+    assert result.blocking_total == 3
+
+    # Suppressed findings are skipped entirely
+    filtered = sc.analyze("serious", lambda f: f["id"] == "A")
+    assert filtered.blocking_ids == ["B"]
+    assert filtered.counts["critical"] == 0
+    assert filtered.counts["minor"] == 1
+
+def test_is_canonical():
+    """is_canonical() is True exactly when canonicalize() is a no-op."""
+    findings = [
+        {"id": "B", "severity": "minor", "message": "msg1"},
+        {"id": "A", "severity": "serious", "message": "msg2"},
+    ]
+    raw = Scorecard(raw={}, findings=findings)
+    assert not raw.is_canonical()
+    canon = raw.canonicalize()
+    assert canon.is_canonical()
+    assert not replace(canon, findings=canon.findings + [dict(canon.findings[0])]).is_canonical()